@@ -1,24 +1,40 @@
+import time
+STARTUP_T0 = time.perf_counter()
 import sys
 import threading
-import time
 import random
 import os
 import json
 import shutil
-import pygame
-import schedule
+import heapq
+import itertools
 import platform
 import math
+import uuid
+import queue
+import sqlite3
+import gzip
+import hashlib
+import bisect
+import re
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from plyer import notification
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QHBoxLayout,QToolBar,
-    QVBoxLayout, QPushButton, QListWidget, QDateTimeEdit, QMessageBox,
-    QMainWindow, QSystemTrayIcon, QMenu, QTimeEdit, QFileDialog, QGroupBox, QRadioButton, QSizePolicy, QToolBar, QDialog
+    QVBoxLayout, QPushButton, QListView, QDateTimeEdit, QMessageBox,
+    QMainWindow, QSystemTrayIcon, QMenu, QTimeEdit, QFileDialog, QGroupBox, QRadioButton, QSizePolicy, QToolBar, QDialog,
+    QCheckBox, QDateEdit, QStackedWidget, QSpinBox
+)
+from PyQt5.QtCore import (
+    Qt, QDateTime, QUrl, QSize, QTime, QObject, pyqtSignal, QVariantAnimation, QPoint, QTimer,
+    QAbstractListModel, QModelIndex, QCoreApplication, QEvent, QFileSystemWatcher
+)
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QMovie, QPainter, QColor, QPen, QFont, QBrush, QPolygon, QImage, QImageReader
 )
-from PyQt5.QtCore import Qt, QDateTime, QUrl, QSize, QTime, QObject, pyqtSignal, QPropertyAnimation, QPoint, QTimer
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtGui import QIcon, QPixmap, QMovie, QPainter, QColor, QPen, QFont, QBrush, QPolygon
 from pathlib import Path
 
 
@@ -43,21 +59,57 @@ ALARM_24H_PATH = RESOURCE_DIR / "alarm24"
 CUSTOM_IMG_PATH = BASE_DIR / "custom_images"
 CUSTOM_SOUND_PATH = BASE_DIR / "custom_sounds"
 CONFIG_FILE = BASE_DIR / "config.json"
+JOURNAL_FILE = BASE_DIR / "journal.log"
+DATABASE_FILE = BASE_DIR / "reminders.db"
+HISTORY_DIR = BASE_DIR / "history"
+HISTORY_ARCHIVE_DIR = HISTORY_DIR / "archive"
+RENDITION_DIR = BASE_DIR / "renditions"
+WEB_PROFILE_DIR = BASE_DIR / "web"
+WEB_CACHE_DIR = WEB_PROFILE_DIR / "cache"
+LMS_URL = "https://lms.telkomuniversity.ac.id"
+# Halaman CeLOE yang tersembunyi dibekukan lalu dibuang (ms)
+WEB_FREEZE_AFTER = 5 * 60 * 1000
+WEB_DISCARD_AFTER = 30 * 60 * 1000
 
 directories = [
-    CUSTOM_IMG_PATH, CUSTOM_SOUND_PATH
+    CUSTOM_IMG_PATH, CUSTOM_SOUND_PATH, HISTORY_ARCHIVE_DIR, RENDITION_DIR
 ]
 for directory in directories:
     directory.mkdir(parents=True, exist_ok=True)
 
-reminders = []
-history = []
 dark_mode = False
 use_custom_image = False
 use_custom_sound = False
 selected_image = None
 selected_sound = None
+history_retention_months = 6
+web_cache_mb = 200
+web_profile = None
 popup_manager = None
+asset_catalog = None
+rendition_cache = None
+sound_cache = None
+alarm_mixer = None
+store = None
+storage = None
+scheduler = None
+
+layer_cache = {}
+
+def cached_layer(name, width, height, dpr, draw):
+    """Static paint layer as a pixmap, rendered once per name, size and pixel ratio."""
+    key = (name, width, height, dpr)
+    pixmap = layer_cache.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter)
+        painter.end()
+        layer_cache[key] = pixmap
+    return pixmap
 
 class AnalogClockPicker(QDialog):
     def __init__(self, parent=None, initial_time=None):
@@ -79,11 +131,6 @@ class AnalogClockPicker(QDialog):
         # Setup UI
         self.setup_ui()
         
-        # Timer for real-time updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update)
-        self.update_timer.start(100)  # Update every 100ms
-        
     def setup_ui(self):
         layout = QVBoxLayout()
         layout.setSpacing(20)
@@ -190,7 +237,7 @@ class AnalogClockPicker(QDialog):
     def set_current_time(self):
         self.selected_time = QTime.currentTime()
         self.update_time_display()
-        self.update()
+        self.clock_widget.update()
         
     def update_time_display(self):
         time_str = self.selected_time.toString("HH:mm:ss")
@@ -201,63 +248,59 @@ class AnalogClockPicker(QDialog):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Dynamic center calculation
-        self.clock_center = QPoint(self.clock_widget.width() // 2, self.clock_widget.height() // 2)
+        width, height = self.clock_widget.width(), self.clock_widget.height()
+        self.clock_center = QPoint(width // 2, height // 2)
+        # Face, markers and numbers only change with size; hands are drawn live
+        face = cached_layer(("clock-face", self.clock_radius), width, height,
+                            self.clock_widget.devicePixelRatioF(), self.draw_face)
+        painter.drawPixmap(0, 0, face)
+
+        # Draw hands
+        self.draw_hands(painter)
+        
+        # Draw center dot
+        painter.setBrush(QBrush(QColor(231, 76, 60)))
+        painter.setPen(QPen(QColor(231, 76, 60)))
+        painter.drawEllipse(self.clock_center.x() - 5, self.clock_center.y() - 5, 10, 10)
+
+    def draw_face(self, painter):
+        cx, cy = self.clock_center.x(), self.clock_center.y()
+        radius = self.clock_radius
+
         # Draw clock face
         painter.setBrush(QBrush(QColor(255, 255, 255)))
         painter.setPen(QPen(QColor(200, 200, 200), 2))
-        painter.drawEllipse(self.clock_center.x() - self.clock_radius, 
-                          self.clock_center.y() - self.clock_radius,
-                          self.clock_radius * 2, self.clock_radius * 2)
+        painter.drawEllipse(cx - radius, cy - radius, radius * 2, radius * 2)
         
-        # Draw hour markers
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
+        # Draw hour markers and numbers
+        marker_pen = QPen(QColor(100, 100, 100), 2)
+        number_pen = QPen(QColor(50, 50, 50))
+        painter.setFont(QFont("Arial", 12, QFont.Bold))
         for i in range(12):
             angle = math.radians(i * 30 - 90)  # -90 to start from top
-            inner_radius = self.clock_radius - 15
-            outer_radius = self.clock_radius - 5
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            inner_radius = radius - 15
+            outer_radius = radius - 5
             
-            x1 = self.clock_center.x() + inner_radius * math.cos(angle)
-            y1 = self.clock_center.y() + inner_radius * math.sin(angle)
-            x2 = self.clock_center.x() + outer_radius * math.cos(angle)
-            y2 = self.clock_center.y() + outer_radius * math.sin(angle)
+            painter.setPen(marker_pen)
+            painter.drawLine(int(cx + inner_radius * cos_a), int(cy + inner_radius * sin_a),
+                             int(cx + outer_radius * cos_a), int(cy + outer_radius * sin_a))
             
-            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-            
-            # Draw hour numbers
-            if i == 0:
-                num = 12
-            else:
-                num = i
-            num_radius = self.clock_radius - 25
-            num_x = self.clock_center.x() + num_radius * math.cos(angle) - 8
-            num_y = self.clock_center.y() + num_radius * math.sin(angle) + 5
-            
-            painter.setFont(QFont("Arial", 12, QFont.Bold))
-            painter.setPen(QPen(QColor(50, 50, 50)))
-            painter.drawText(int(num_x), int(num_y), str(num))
+            num = 12 if i == 0 else i
+            num_radius = radius - 25
+            painter.setPen(number_pen)
+            painter.drawText(int(cx + num_radius * cos_a - 8), int(cy + num_radius * sin_a + 5), str(num))
         
         # Draw minute markers
         painter.setPen(QPen(QColor(150, 150, 150), 1))
         for i in range(60):
             if i % 5 != 0:  # Skip hour markers
                 angle = math.radians(i * 6 - 90)
-                inner_radius = self.clock_radius - 10
-                outer_radius = self.clock_radius - 5
-                
-                x1 = self.clock_center.x() + inner_radius * math.cos(angle)
-                y1 = self.clock_center.y() + inner_radius * math.sin(angle)
-                x2 = self.clock_center.x() + outer_radius * math.cos(angle)
-                y2 = self.clock_center.y() + outer_radius * math.sin(angle)
-                
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-        
-        # Draw hands
-        self.draw_hands(painter)
-        
-        # Draw center dot
-        painter.setBrush(QBrush(QColor(231, 76, 60)))
-        painter.setPen(QPen(QColor(231, 76, 60)))
-        painter.drawEllipse(self.clock_center.x() - 5, self.clock_center.y() - 5, 10, 10)
+                cos_a, sin_a = math.cos(angle), math.sin(angle)
+                inner_radius = radius - 10
+                outer_radius = radius - 5
+                painter.drawLine(int(cx + inner_radius * cos_a), int(cy + inner_radius * sin_a),
+                                 int(cx + outer_radius * cos_a), int(cy + outer_radius * sin_a))
         
     def draw_hands(self, painter):
         hour = self.selected_time.hour() % 12
@@ -379,7 +422,7 @@ class AnalogClockPicker(QDialog):
 
         self.selected_time = QTime(hour, minute, second)
         self.update_time_display()
-        self.update()
+        self.clock_widget.update()
 
         
     def get_selected_time(self):
@@ -444,84 +487,491 @@ class TimePickerWidget(QPushButton):
     def time(self):
         return self.current_time
 
+PREVIEW_SIZE = 180
+
+def popup_size(source_size, screen):
+    """Popup size for an image: at least 300px, at most 80% of the screen, aspect kept."""
+    max_width = screen.width() * 0.8
+    max_height = screen.height() * 0.8
+    width = source_size.width()
+    height = source_size.height()
+    aspect = width / height
+    width = max(width, 300)
+    height = max(height, 300)
+    if width > max_width or height > max_height:
+        if width / max_width > height / max_height:
+            width = max_width
+            height = width / aspect
+        else:
+            height = max_height
+            width = height * aspect
+    return int(width), int(height)
+
+class RenditionCache(QObject):
+    """Pre-scaled image copies under BASE_DIR/renditions, keyed by content hash."""
+    BUDGET = 64 * 1024 * 1024
+    ready = pyqtSignal(str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.digests = {}  # path -> (size, mtime_ns, sha1)
+        self.pending = set()
+        self.lock = threading.Lock()
+
+    def digest(self, path):
+        st = os.stat(path)
+        known = self.digests.get(path)
+        if known and known[:2] == (st.st_size, st.st_mtime_ns):
+            return known[2]
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha1.update(chunk)
+        digest = sha1.hexdigest()
+        self.digests[path] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def rendition_path(self, path, width, height, dpr):
+        return RENDITION_DIR / f"{self.digest(path)}_{width}x{height}@{dpr:g}.png"
+
+    def pixmap(self, path, width, height, dpr):
+        """The cached rendition as a QPixmap, or None after queueing it."""
+        try:
+            target = self.rendition_path(path, width, height, dpr)
+        except OSError:
+            return None
+        if target.exists():
+            pixmap = QPixmap(str(target))
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(dpr)
+                try:
+                    os.utime(target)
+                except OSError:
+                    pass
+                return pixmap
+        self.request(path, width, height, dpr)
+        return None
+
+    def request(self, path, width, height, dpr):
+        key = (path, width, height, dpr)
+        with self.lock:
+            if key in self.pending:
+                return
+            self.pending.add(key)
+
+        def render():
+            try:
+                target = self.rendition_path(path, width, height, dpr)
+                if not target.exists():
+                    image = QImage(path).scaled(int(width * dpr), int(height * dpr),
+                                                Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    tmp = target.with_name(target.name + ".tmp")
+                    if image.isNull() or not image.save(str(tmp), "PNG"):
+                        return
+                    os.replace(tmp, target)
+                    try:
+                        self.prune(keep=target)
+                    except OSError as e:
+                        print(f"Error pruning renditions: {e}")
+                self.ready.emit(path, str(target))
+            except Exception as e:
+                print(f"Error rendering {path}: {e}")
+            finally:
+                with self.lock:
+                    self.pending.discard(key)
+        threading.Thread(target=render, daemon=True).start()
+
+    def prune(self, keep=None):
+        files = []
+        for entry in os.scandir(RENDITION_DIR):
+            try:
+                if entry.is_file() and entry.name.endswith(".png"):
+                    st = entry.stat()
+                    files.append((st.st_mtime, st.st_size, entry.path))
+            except OSError:
+                continue  # removed by another render thread's prune
+        total = sum(size for _, size, _ in files)
+        for _, size, file_path in sorted(files):
+            if total <= self.BUDGET:
+                break
+            if keep is not None and file_path == str(keep):
+                continue
+            try:
+                os.remove(file_path)
+                total -= size
+            except OSError:
+                pass
+
+    def prepare(self, path):
+        """Queue the Customize preview and the popup rendition for `path`."""
+        screen = QApplication.primaryScreen()
+        dpr = screen.devicePixelRatio()
+        self.request(path, PREVIEW_SIZE, PREVIEW_SIZE, dpr)
+        if not path.lower().endswith('.gif'):
+            size = QImageReader(path).size()
+            if size.isValid():
+                self.request(path, *popup_size(size, screen.availableGeometry()), dpr)
+
 class ImagePopup(QWidget):
+    """Reminder image on top for 20 seconds, sized once per image and screen."""
     def __init__(self, image_path):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.setStyleSheet("background-color: transparent;")
         layout = QVBoxLayout()
         self.image_label = QLabel()
         layout.addWidget(self.image_label)
         self.setLayout(layout)
+        self.movie = None
+        self.screen_watched = False
         if image_path.lower().endswith('.gif'):
             self.movie = QMovie(image_path)
-            self.movie.frameChanged.connect(self.adjust_size)
             self.image_label.setMovie(self.movie)
+            self.movie.jumpToFrame(0)
+            self.source_size = self.movie.currentImage().size()
+            if not self.source_size.isValid():
+                # Size only known once a frame has decoded
+                self.movie.frameChanged.connect(self.on_first_frame)
             self.movie.start()
         else:
-            self.pixmap = QPixmap(image_path)
-            self.adjust_size()
-        self.center_on_screen()
-        self.timer = threading.Timer(20.0, self.close)
-        self.timer.start()
-
-    def adjust_size(self, frame_num=0):
-        if hasattr(self, 'movie'):
-            size = self.movie.currentImage().size()
-            if not size.isValid():
-                return
-        else:
-            size = self.pixmap.size()
-            if not size.isValid():
-                return
-        screen = QApplication.primaryScreen().availableGeometry()
-        max_width = screen.width() * 0.8
-        max_height = screen.height() * 0.8
-        width = size.width()
-        height = size.height()
-        aspect = width / height
-        width = max(width, 300)
-        height = max(height, 300)
-        if width > max_width or height > max_height:
-            if width / max_width > height / max_height:
-                width = max_width
-                height = width / aspect
-            else:
-                height = max_height
-                width = height * aspect
-        if hasattr(self, 'movie'):
-            self.movie.setScaledSize(QSize(int(width), int(height)))
-            self.image_label.setFixedSize(int(width), int(height))
+            self.image_path = image_path
+            # Only the header is read here; the pixels come pre-scaled when cached
+            self.source_size = QImageReader(image_path).size()
+        self.fit_to_screen()
+        # Timer owned by the popup, so it dies with it and fires on the GUI thread
+        self.close_timer = QTimer(self)
+        self.close_timer.setSingleShot(True)
+        self.close_timer.timeout.connect(self.close)
+        self.close_timer.start(20000)
+
+    def on_first_frame(self, frame_num):
+        size = self.movie.currentImage().size()
+        if size.isValid():
+            self.movie.frameChanged.disconnect(self.on_first_frame)
+            self.source_size = size
+            self.fit_to_screen()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.screen_watched:
+            self.screen_watched = True
+            self.windowHandle().screenChanged.connect(self.fit_to_screen)
+
+    def current_screen(self):
+        handle = self.windowHandle()
+        return handle.screen() if handle is not None else QApplication.primaryScreen()
+
+    def fit_to_screen(self, *args):
+        if not self.source_size.isValid():
+            return
+        current = self.current_screen()
+        screen = current.availableGeometry()
+        width, height = popup_size(self.source_size, screen)
+        if self.movie is not None:
+            self.movie.setScaledSize(QSize(width, height))
         else:
-            scaled_pixmap = self.pixmap.scaled(int(width), int(height), 
-                                             Qt.KeepAspectRatio, 
-                                             Qt.SmoothTransformation)
+            scaled_pixmap = rendition_cache.pixmap(self.image_path, width, height,
+                                                   current.devicePixelRatio())
+            if scaled_pixmap is None:
+                # Not cached yet (now queued); scale this once directly
+                scaled_pixmap = QPixmap(self.image_path).scaled(width, height,
+                                                                Qt.KeepAspectRatio,
+                                                                Qt.SmoothTransformation)
             self.image_label.setPixmap(scaled_pixmap)
-            self.image_label.setFixedSize(int(width), int(height))
-        self.resize(int(width), int(height))
-        self.center_on_screen()
+        self.image_label.setFixedSize(width, height)
+        self.resize(width, height)
+        self.center_on_screen(screen)
 
-    def center_on_screen(self):
-        screen = QApplication.primaryScreen().availableGeometry()
+    def center_on_screen(self, screen):
         size = self.size()
         self.move(
-            (screen.width() - size.width()) // 2,
-            (screen.height() - size.height()) // 2
+            screen.x() + (screen.width() - size.width()) // 2,
+            screen.y() + (screen.height() - size.height()) // 2
         )
 
 class PopupManager(QObject):
     show_image_signal = pyqtSignal(str)
     def __init__(self):
         super().__init__()
+        self.popups = set()  # keep open popups referenced until they close
         self.show_image_signal.connect(self._show_image_popup)
 
     def _show_image_popup(self, image_path):
         popup = ImagePopup(image_path)
+        self.popups.add(popup)
+        popup.destroyed.connect(lambda: self.popups.discard(popup))
         popup.show()
         popup.raise_()
         popup.activateWindow()
 
+class DeadlineColumn:
+    """Deadlines as a sorted int64 array with parallel ids, for bisect range queries."""
+    def __init__(self, reminders=()):
+        by_due = sorted(reminders, key=lambda r: r.due)
+        self.dues = array('q', (r.due for r in by_due))
+        self.ids = [r.id for r in by_due]
+
+    def add(self, reminder):
+        pos = bisect.bisect_right(self.dues, reminder.due)
+        self.dues.insert(pos, reminder.due)
+        self.ids.insert(pos, reminder.id)
+
+    def remove(self, reminder):
+        pos = bisect.bisect_left(self.dues, reminder.due)
+        while pos < len(self.ids) and self.ids[pos] != reminder.id:
+            pos += 1
+        if pos < len(self.ids):
+            del self.dues[pos]
+            del self.ids[pos]
+
+    def between(self, start, end):
+        """Ids with start <= due < end, soonest first."""
+        lo = bisect.bisect_left(self.dues, start)
+        hi = bisect.bisect_left(self.dues, end, lo)
+        return self.ids[lo:hi]
+
+def tokenize(text):
+    return re.findall(r"\w+", text.lower())
+
+class SearchIndex:
+    """Title prefix index plus a DeadlineColumn for date ranges."""
+    def __init__(self, reminders=()):
+        self.records = {}  # id -> Reminder
+        self._postings = {}  # token -> ids
+        self._tokens = []  # distinct tokens, sorted
+        self.deadlines = DeadlineColumn()
+        self.add_many(reminders)
+
+    def add_many(self, reminders):
+        reminders = [r for r in reminders if r.id not in self.records]
+        new_tokens = set()
+        for r in reminders:
+            self.records[r.id] = r
+            for token in set(tokenize(r.title)):
+                if token not in self._postings:
+                    self._postings[token] = set()
+                    new_tokens.add(token)
+                self._postings[token].add(r.id)
+        if len(reminders) == 1:
+            for token in new_tokens:
+                bisect.insort(self._tokens, token)
+        elif new_tokens:
+            self._tokens = sorted(self._tokens + list(new_tokens))
+        if len(reminders) > 1:
+            self.deadlines = DeadlineColumn(self.records.values())
+        elif reminders:
+            self.deadlines.add(reminders[0])
+
+    def add(self, reminder):
+        self.add_many([reminder])
+
+    def remove(self, reminder):
+        if self.records.pop(reminder.id, None) is None:
+            return
+        for token in set(tokenize(reminder.title)):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(reminder.id)
+            if not ids:
+                del self._postings[token]
+                del self._tokens[bisect.bisect_left(self._tokens, token)]
+        self.deadlines.remove(reminder)
+
+    def _prefix_ids(self, prefix):
+        lo = bisect.bisect_left(self._tokens, prefix)
+        hi = bisect.bisect_left(self._tokens, prefix + "\uffff", lo)
+        ids = set()
+        for token in self._tokens[lo:hi]:
+            ids |= self._postings[token]
+        return ids
+
+    def search(self, text, start=None, end=None):
+        """Matching reminders ordered by deadline, or None when there is no filter."""
+        words = tokenize(text)
+        if not words and start is None and end is None:
+            return None
+        candidates = None
+        for word in words:
+            ids = self._prefix_ids(word)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        if start is not None or end is not None:
+            in_range = self.deadlines.between(start or 0, end or 2 ** 63 - 1)
+            return [self.records[i] for i in in_range if candidates is None or i in candidates]
+        return sorted((self.records[i] for i in candidates), key=lambda r: r.due)
+
+class ReminderStore(QObject):
+    """Owns reminders and history; submit() from any thread, applied on the GUI thread."""
+    reminder_added = pyqtSignal(int)    # row
+    reminder_updated = pyqtSignal(int)  # row
+    reminder_removed = pyqtSignal(int)  # row
+    history_appended = pyqtSignal(object)
+    history_search_changed = pyqtSignal()  # archived months became searchable
+    _wake = pyqtSignal()
+    _archive_indexed = pyqtSignal(object)
+    _BUILDING = object()
+
+    def __init__(self):
+        super().__init__()
+        self.reminders = []
+        self.index = {}  # reminder id -> record in `reminders`
+        self.rows = {}  # reminder id -> position in `reminders`
+        self.history = []
+        self.storage = None
+        self.reminder_search = SearchIndex()
+        self._history_search = None
+        self._archive_search = None  # archived months, indexed while a filter is active
+        self._queue = queue.SimpleQueue()
+        self._wake.connect(self._drain, Qt.QueuedConnection)
+        self._archive_indexed.connect(self._on_archive_indexed, Qt.QueuedConnection)
+
+    def load(self, reminders, history):
+        self.reminders = list(reminders)
+        self.index = {r.id: r for r in self.reminders}
+        self.rows = {r.id: row for row, r in enumerate(self.reminders)}
+        self.history = history
+        self.reminder_search = SearchIndex(self.reminders)
+        self._history_search = None
+        self._archive_search = None
+
+    def get(self, reminder_id):
+        return self.index.get(reminder_id)
+
+    def due_between(self, start, end):
+        """Ids of pending reminders with start <= due < end, soonest first."""
+        return self.reminder_search.deadlines.between(start, end)
+
+    def search_reminders(self, text, start=None, end=None):
+        return self.reminder_search.search(text, start, end)
+
+    def search_history(self, text, start=None, end=None):
+        if not tokenize(text) and start is None and end is None:
+            # Filter cleared: don't keep the archived months in memory
+            self._archive_search = None
+            return None
+        if self._history_search is None:
+            # Built once over the loaded history, then kept up to date
+            self._history_search = SearchIndex(self.history)
+        results = self._history_search.search(text, start, end)
+        archive = self._archive_search
+        if archive is None:
+            self._index_archive()
+        elif archive is not self._BUILDING:
+            seen = {r.id for r in results}
+            extra = [r for r in archive.search(text, start, end) if r.id not in seen]
+            if extra:
+                results = sorted(results + extra, key=lambda r: r.due)
+        return results
+
+    def _index_archive(self):
+        # Archived months are read and indexed in a thread, without loading them into the history
+        months = self.history.cold_months()
+        if not months:
+            self._archive_search = SearchIndex()
+            return
+        self._archive_search = self._BUILDING
+        segments = self.history.segments
+
+        def build():
+            entries = [r for month in months for r in segments.read(month)]
+            self._archive_indexed.emit(SearchIndex(entries))
+        threading.Thread(target=build, daemon=True).start()
+
+    def _on_archive_indexed(self, index):
+        if self._archive_search is self._BUILDING:
+            self._archive_search = index
+            self.history_search_changed.emit()
+
+    def load_older_history(self):
+        older = self.history.load_older()
+        if self._history_search is not None:
+            self._history_search.add_many(older)
+        return older
+
+    def submit(self, command, *args):
+        self._queue.put((command, args))
+        self._wake.emit()
+
+    def _log(self, op, reminder_id, reminder=None, **extra):
+        if self.storage is None:
+            return
+        record = {"op": op, "id": reminder_id, **extra}
+        if reminder is not None:
+            record.update(reminder_to_json(reminder))
+        self.storage.append(record)
+
+    def _drain(self):
+        while True:
+            try:
+                command, args = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                getattr(self, "_do_" + command)(*args)
+            except Exception as e:
+                print(f"Error applying {command}: {e}")
+
+    def _do_add(self, title, dt):
+        reminder = Reminder.from_datetime(title, dt)
+        self.rows[reminder.id] = len(self.reminders)
+        self.reminders.append(reminder)
+        self.index[reminder.id] = reminder
+        self.reminder_search.add(reminder)
+        self._log("add", reminder.id, reminder)
+        schedule_notification(reminder)
+        self.reminder_added.emit(len(self.reminders) - 1)
+
+    def _do_edit(self, reminder_id, title, dt):
+        old = self.index.get(reminder_id)
+        if old is None:
+            return
+        reminder = Reminder.from_datetime(title, dt, reminder_id)
+        row = self.rows[reminder_id]
+        self.reminders[row] = reminder
+        self.index[reminder_id] = reminder
+        self.reminder_search.remove(old)
+        self.reminder_search.add(reminder)
+        self._log("edit", reminder_id, reminder)
+        cancel_scheduled(reminder_id)
+        schedule_notification(reminder)
+        self.reminder_updated.emit(row)
+
+    def _do_delete(self, reminder_id):
+        cancel_scheduled(reminder_id)
+        self._move_to_history("delete", reminder_id)
+
+    def _do_expire(self, reminder_id, due):
+        reminder = self.index.get(reminder_id)
+        # Edited to a new deadline while the alert was in flight: keep it pending
+        if reminder is None or reminder.due != due:
+            return
+        self._move_to_history("expire", reminder_id)
+
+    def _move_to_history(self, op, reminder_id):
+        reminder = self.index.pop(reminder_id, None)
+        if reminder is None:
+            return
+        self.reminder_search.remove(reminder)
+        row = self.rows.pop(reminder_id)
+        reminder = reminder.closed(op)
+        # History is written first; the journal record then marks it archived
+        self.history.append(reminder)
+        if self._history_search is not None:
+            self._history_search.add(reminder)
+        self._log(op, reminder_id, archived=True)
+        last = self.reminders.pop()
+        if row < len(self.reminders):
+            # Fill the gap with the last row instead of shifting every row after it
+            self.reminders[row] = last
+            self.rows[last.id] = row
+            self.reminder_updated.emit(row)
+        self.reminder_removed.emit(len(self.reminders))
+        self.history_appended.emit(reminder)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -530,27 +980,20 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("CeLOE Reminder App")
         self.setMinimumSize(720, 850)
 
-        # Central widget untuk ganti konten
-        self.central_widget = QWidget()
-        self.central_layout = QVBoxLayout()
-        self.central_widget.setLayout(self.central_layout)
-        self.setCentralWidget(self.central_widget)
-
-        # Inisialisasi halaman
-        self.reminder_tab = ReminderTab()
-        self.celoe_tab = BrowserTab()
-        self.customize_tab = CustomizeTab()
-        self.history_tab = HistoryTab()  # Add history tab
-        self.reminder_tab.refresh_reminder_list()
+        # Halaman ditumpuk; tiap halaman baru dibuat saat pertama dibuka
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+        self.page_factories = [BrowserTab, ReminderTab, HistoryTab, CustomizeTab]
+        self.pages = [None] * len(self.page_factories)
+        for _ in self.page_factories:
+            self.stack.addWidget(QWidget())  # placeholder until first visit
 
         # --- NAVBAR KIRI: pakai QToolBar vertikal ---
         toolbar = QToolBar("MainToolbar")
+        toolbar.setObjectName("mainToolbar")
         toolbar.setMovable(False)
         toolbar.setFloatable(False)
         toolbar.setOrientation(Qt.Vertical)
-        toolbar.setStyleSheet("""
-            QToolBar { background: #121212; border: none; padding: 0; }
-        """)
         self.addToolBar(Qt.LeftToolBarArea, toolbar)
 
         # Tambahkan logo di atas
@@ -569,17 +1012,18 @@ class MainWindow(QMainWindow):
 
         # Tombol tab utama (vertikal, rata kiri, warna merah)
         self.tab_buttons = []
-        self.tab_pages = [self.celoe_tab, self.reminder_tab, self.history_tab, self.customize_tab]
         tab_names = ["CeLOE", "Reminder", "History", "Customize"]  # Add "History" tab
 
-        for i, (tab_name, tab_page) in enumerate(zip(tab_names, self.tab_pages)):
+        for i, tab_name in enumerate(tab_names):
             btn = QPushButton(tab_name)
+            btn.setObjectName("navButton")
+            btn.setProperty("active", False)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setFlat(True)
             btn.setMinimumWidth(120)
             btn.setMaximumWidth(160)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            btn.clicked.connect(lambda checked, idx=i: self.show_page(self.tab_pages[idx], idx))
+            btn.clicked.connect(lambda checked, idx=i: self.show_page(idx))
             toolbar.addWidget(btn)
             self.tab_buttons.append(btn)
 
@@ -596,8 +1040,9 @@ class MainWindow(QMainWindow):
         
         self.theme_toggle = QWidget()
         self.theme_toggle.setFixedSize(50, 24)
-        self.theme_toggle_animation = QPropertyAnimation(self.theme_toggle, b"toggle_position")
+        self.theme_toggle_animation = QVariantAnimation(self)
         self.theme_toggle_animation.setDuration(200)
+        self.theme_toggle_animation.valueChanged.connect(self.move_theme_knob)
         self.theme_toggle.toggle_position = 0
         self.theme_toggle.setStyleSheet("""
             QWidget {
@@ -613,26 +1058,16 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(toggle_container)
 
         self.dark_mode = False
-        self.active_tab_index = 0
+        self.active_tab_index = None
         self.apply_theme()
-        self.show_page(self.celoe_tab, 0)
+        self.show_page(0)
 
     def paint_toggle(self, e):
         painter = QPainter(self.theme_toggle)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        painter.setPen(Qt.NoPen)
-        if self.dark_mode:
-            # Dark mode - red background
-            painter.setBrush(QColor("#b00"))
-        else:
-            # Light mode - white background with red border
-            painter.setBrush(QColor("white"))
-            pen = QPen(QColor("#b00"), 2)
-            painter.setPen(pen)
-        
-        painter.drawRoundedRect(0, 0, 50, 24, 12, 12)
+        track = cached_layer(("theme-toggle", self.dark_mode), 50, 24,
+                             self.theme_toggle.devicePixelRatioF(), self.draw_toggle_track)
+        painter.drawPixmap(0, 0, track)
         
         # Draw toggle circle
         if self.dark_mode:
@@ -646,87 +1081,86 @@ class MainWindow(QMainWindow):
         # Use the animated position for smooth movement
         x = 4 + (self.theme_toggle.toggle_position * 26)
         painter.drawEllipse(int(x), 4, 16, 16)
-        self.theme_toggle.update()  # Force redraw during animation
+
+    def draw_toggle_track(self, painter):
+        painter.setPen(Qt.NoPen)
+        if self.dark_mode:
+            # Dark mode - red background
+            painter.setBrush(QColor("#b00"))
+        else:
+            # Light mode - white background with red border
+            painter.setBrush(QColor("white"))
+            pen = QPen(QColor("#b00"), 2)
+            painter.setPen(pen)
+        
+        painter.drawRoundedRect(0, 0, 50, 24, 12, 12)
+
+    def move_theme_knob(self, value):
+        self.theme_toggle.toggle_position = value
+        self.theme_toggle.update()
 
     def toggle_theme(self):
+        global dark_mode
         self.dark_mode = not self.dark_mode
-        self.theme_toggle_animation.setStartValue(self.theme_toggle.toggle_position)
-        self.theme_toggle_animation.setEndValue(1 if self.dark_mode else 0)
+        dark_mode = self.dark_mode
+        record_settings()
+        self.theme_toggle_animation.setStartValue(float(self.theme_toggle.toggle_position))
+        self.theme_toggle_animation.setEndValue(1.0 if self.dark_mode else 0.0)
         self.theme_toggle_animation.start()
-        self.theme_toggle.toggle_position = 1 if self.dark_mode else 0
         self.apply_theme()
 
     def _move_theme_toggle(self, event):
         self.theme_toggle.move(self.width() - 120, 10)
 
-    def show_page(self, widget, tab_index=None):
-        # Ganti konten central widget
-        for i in reversed(range(self.central_layout.count())):
-            item = self.central_layout.itemAt(i)
-            widget_to_remove = item.widget()
-            if widget_to_remove:
-                widget_to_remove.setParent(None)
-        self.central_layout.addWidget(widget)
-        if isinstance(widget, HistoryTab):
-            widget.refresh_history()
+    def page(self, tab_index):
+        if self.pages[tab_index] is None:
+            page = self.page_factories[tab_index]()
+            placeholder = self.stack.widget(tab_index)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stack.insertWidget(tab_index, page)
+            self.pages[tab_index] = page
+        return self.pages[tab_index]
+
+    @property
+    def celoe_tab(self):
+        return self.page(0)
+
+    @property
+    def reminder_tab(self):
+        return self.page(1)
+
+    @property
+    def history_tab(self):
+        return self.page(2)
+
+    @property
+    def customize_tab(self):
+        return self.page(3)
+
+    def show_page(self, tab_index):
+        self.page(tab_index)
+        self.stack.setCurrentIndex(tab_index)
         # Highlight tab aktif
-        if tab_index is not None:
-            self.active_tab_index = tab_index
+        self.active_tab_index = tab_index
         self.update_tab_highlight()
 
     def update_tab_highlight(self):
+        # Only the buttons whose "active" property flips need a re-polish
         for i, btn in enumerate(self.tab_buttons):
-            if i == self.active_tab_index:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background: #fde8e7;
-                        border: none;
-                        padding: 12px 24px;
-                        font-weight: 600;
-                        font-size: 14px;
-                        color: #E74C3C;
-                        text-align: left;
-                        border-radius: 8px;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background: transparent;
-                        border: none;
-                        padding: 12px 24px;
-                        font-weight: 500;
-                        font-size: 14px;
-                        color: #95a5a6;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background: #f8f9fa;
-                        color: #E74C3C;
-                        border-radius: 8px;
-                    }
-                """)
+            active = i == self.active_tab_index
+            if btn.property("active") != active:
+                btn.setProperty("active", active)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
 
     def apply_theme(self):
-        stylesheet = get_dark_stylesheet() if self.dark_mode else get_light_stylesheet()
-        self.setStyleSheet(stylesheet)
-        # Ubah warna tombol sesuai mode
-        if self.dark_mode:
-            highlight_bg = "#2d1a1a"
-            btn_style = "background: transparent; border: none; padding: 12px 8px; font-weight: bold; font-size: 14px; color: #e57373; text-align: left;"
-            highlight_style = f"background: {highlight_bg}; border: none; padding: 12px 8px; font-weight: bold; font-size: 14px; color: #e57373; text-align: left; border-radius: 8px;"
-            toolbar_style = "QToolBar { background: #121212; border: none; padding: 0; }"
-        else:
-            highlight_bg = "#ffeaea"
-            btn_style = "background: transparent; border: none; padding: 12px 8px; font-weight: bold; font-size: 14px; color: #b00; text-align: left;"
-            highlight_style = f"background: {highlight_bg}; border: none; padding: 12px 8px; font-weight: bold; font-size: 14px; color: #b00; text-align: left; border-radius: 8px;"
-            toolbar_style = "QToolBar { background: white; border: none; padding: 0; }"
-        for i, btn in enumerate(self.tab_buttons):
-            if i == self.active_tab_index:
-                btn.setStyleSheet(highlight_style)
-            else:
-                btn.setStyleSheet(btn_style)
-        self.findChild(QToolBar).setStyleSheet(toolbar_style)
+        self.setStyleSheet(get_dark_stylesheet() if self.dark_mode else get_light_stylesheet())
+        self.theme_toggle.update()
+
+    def release_web_view(self):
+        if self.pages[0] is not None:
+            self.pages[0].release_browser()
 
     def closeEvent(self, event):
         event.ignore()
@@ -775,18 +1209,18 @@ def get_dark_stylesheet():
         font-weight: 500;
         color: #e0e0e0;
     }
-    QListWidget {
+    QListView {
         border: 2px solid #2f2f2f;
         border-radius: 8px;
         padding: 10px;
         background: #2a2a2a;
         color: #e0e0e0;
     }
-    QListWidget::item:selected {
+    QListView::item:selected {
         background-color: #E74C3C33;
         color: #E74C3C;
     }
-    QListWidget::item:hover {
+    QListView::item:hover {
         background: #393939;
     }
     QGroupBox {
@@ -828,6 +1262,55 @@ def get_dark_stylesheet():
         selection-background-color: #E74C3C;
         selection-color: white;
     }
+    QToolBar#mainToolbar {
+        background: #121212;
+        border: none;
+        padding: 0;
+    }
+    QPushButton#navButton {
+        background: transparent;
+        border: none;
+        padding: 12px 8px;
+        font-weight: bold;
+        font-size: 14px;
+        color: #e57373;
+        text-align: left;
+        border-radius: 8px;
+    }
+    QPushButton#navButton:hover {
+        background: #262626;
+    }
+    QPushButton#navButton[active="true"] {
+        background: #2d1a1a;
+    }
+    QWidget#settingsCard {
+        background: #262626;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+        padding: 24px;
+        margin: 8px 0;
+    }
+    QLabel#imagePreview {
+        background: #333333;
+        border: 2px dashed #404040;
+        border-radius: 12px;
+    }
+    QPushButton:disabled {
+        background: #404040;
+    }
+    QPushButton#outlineButton {
+        background: #333333;
+        color: #E74C3C;
+        border: 2px solid #E74C3C;
+        padding: 12px 24px;
+    }
+    QPushButton#outlineButton:hover {
+        background: #404040;
+    }
+    QPushButton#outlineButton:disabled {
+        border-color: #404040;
+        color: #404040;
+    }
     """
 
 def get_light_stylesheet():
@@ -866,17 +1349,17 @@ def get_light_stylesheet():
         font-weight: 500;
         color: #2c3e50;
     }
-    QListWidget {
+    QListView {
         border: 2px solid #ddd;
         border-radius: 8px;
         padding: 10px;
         background: #fafafa;
     }
-    QListWidget::item:selected {
+    QListView::item:selected {
         background-color: #fde8e7;
         color: #E74C3C;
     }
-    QListWidget::item:hover {
+    QListView::item:hover {
         background: #f0f0f0;
     }
     QGroupBox {
@@ -918,8 +1401,162 @@ def get_light_stylesheet():
         selection-background-color: #E74C3C;
         selection-color: white;
     }
+    QToolBar#mainToolbar {
+        background: white;
+        border: none;
+        padding: 0;
+    }
+    QPushButton#navButton {
+        background: transparent;
+        border: none;
+        padding: 12px 8px;
+        font-weight: bold;
+        font-size: 14px;
+        color: #b00;
+        text-align: left;
+        border-radius: 8px;
+    }
+    QPushButton#navButton:hover {
+        background: #f8f9fa;
+    }
+    QPushButton#navButton[active="true"] {
+        background: #ffeaea;
+    }
+    QWidget#settingsCard {
+        background: white;
+        border: 1px solid rgba(0, 0, 0, 0.1);
+        border-radius: 16px;
+        padding: 24px;
+        margin: 8px 0;
+    }
+    QLabel#imagePreview {
+        background: #f8f9fa;
+        border: 2px dashed #dee2e6;
+        border-radius: 12px;
+    }
+    QPushButton:disabled {
+        background: #bdc3c7;
+    }
+    QPushButton#outlineButton {
+        background: #f8f9fa;
+        color: #E74C3C;
+        border: 2px solid #E74C3C;
+        padding: 12px 24px;
+    }
+    QPushButton#outlineButton:hover {
+        background: #fee2e2;
+    }
+    QPushButton#outlineButton:disabled {
+        border-color: #bdc3c7;
+        color: #bdc3c7;
+    }
     """
 
+def format_reminder(r):
+    return f"{r.title} | {r.datetime.strftime('%Y-%m-%d %H:%M:%S')}"
+
+class ReminderListModel(QAbstractListModel):
+    """List model over store.reminders, or the search results while filtered."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = list(store.reminders)
+        self._query = None
+        store.reminder_added.connect(self.on_reminder_added)
+        store.reminder_updated.connect(self.on_reminder_updated)
+        store.reminder_removed.connect(self.on_reminder_removed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return format_reminder(self._rows[index.row()])
+
+    def reminder(self, row):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def set_filter(self, text, start=None, end=None):
+        self._query = (text, start, end)
+        self.reset()
+
+    def reset(self):
+        self.beginResetModel()
+        results = store.search_reminders(*self._query) if self._query else None
+        if results is None:
+            self._query = None
+            results = store.reminders
+        self._rows = list(results)
+        self.endResetModel()
+
+    def on_reminder_added(self, row):
+        if self._query:
+            self.reset()
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, store.reminders[row])
+        self.endInsertRows()
+
+    def on_reminder_updated(self, row):
+        if self._query:
+            self.reset()
+            return
+        self._rows[row] = store.reminders[row]
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def on_reminder_removed(self, row):
+        if self._query:
+            self.reset()
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+class SearchBar(QWidget):
+    """Search box with optional date range; emits (text, start epoch, end epoch or None)."""
+    changed = pyqtSignal(str, object, object)
+
+    def __init__(self, placeholder="Cari judul...", parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.text_input = QLineEdit()
+        self.text_input.setPlaceholderText(placeholder)
+        self.text_input.setClearButtonEnabled(True)
+        self.text_input.setStyleSheet("font-size: 13px; padding: 6px 10px;")
+        self.text_input.textChanged.connect(self.emit_changed)
+
+        self.range_check = QCheckBox("Tanggal")
+        self.range_check.toggled.connect(self.on_range_toggled)
+        self.from_date = QDateEdit(QDateTime.currentDateTime().date())
+        self.to_date = QDateEdit(QDateTime.currentDateTime().date())
+        for date_edit in (self.from_date, self.to_date):
+            date_edit.setDisplayFormat("dd/MM/yyyy")
+            date_edit.setCalendarPopup(True)
+            date_edit.setEnabled(False)
+            date_edit.dateChanged.connect(self.emit_changed)
+
+        layout.addWidget(self.text_input, 1)
+        layout.addWidget(self.range_check)
+        layout.addWidget(self.from_date)
+        layout.addWidget(self.to_date)
+        self.setLayout(layout)
+
+    def on_range_toggled(self, checked):
+        self.from_date.setEnabled(checked)
+        self.to_date.setEnabled(checked)
+        self.emit_changed()
+
+    def emit_changed(self, *args):
+        start = end = None
+        if self.range_check.isChecked():
+            start = int(datetime.combine(self.from_date.date().toPyDate(), datetime.min.time()).timestamp())
+            end = int(datetime.combine(self.to_date.date().toPyDate() + timedelta(days=1), datetime.min.time()).timestamp())
+        self.changed.emit(self.text_input.text(), start, end)
+
 class ReminderTab(QWidget):
     def __init__(self):
         super().__init__()
@@ -1014,36 +1651,45 @@ class ReminderTab(QWidget):
         list_label.setStyleSheet("font-size: 13px; font-weight: bold; margin-top: 18px;")
         self.layout.addWidget(list_label)
 
+        # Pencarian
+        self.search_bar = SearchBar()
+        self.layout.addWidget(self.search_bar)
+
         # List reminder
-        self.reminder_list = QListWidget()
+        self.reminder_model = ReminderListModel(self)
+        self.reminder_list = QListView()
+        self.reminder_list.setModel(self.reminder_model)
+        self.reminder_list.setUniformItemSizes(True)
         self.reminder_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #bbb;
                 border-radius: 8px;
                 padding: 8px;
                 font-size: 15px;
                 min-height: 180px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: #0d6efd33;
                 color: #0d6efd;
             }
         """)
-        self.reminder_list.itemClicked.connect(self.on_select)
+        self.reminder_list.clicked.connect(self.on_select)
+        self.search_bar.changed.connect(self.reminder_model.set_filter)
         self.layout.addWidget(self.reminder_list)
 
         self.setLayout(self.layout)
-        pygame.mixer.init()
-
-    def on_select(self, item):
-        index = self.reminder_list.row(item)
-        if 0 <= index < len(reminders):
-            reminder = reminders[index]
-            self.title_input.setText(reminder['title'])
-            dt = reminder['datetime']
+
+    def on_select(self, index):
+        reminder = self.reminder_model.reminder(index.row())
+        if reminder is not None:
+            self.title_input.setText(reminder.title)
+            dt = reminder.datetime
             self.date_input.setDate(dt.date())
             self.time_input.setTime(QTime(dt.hour, dt.minute, dt.second))
 
+    def selected_reminder(self):
+        return self.reminder_model.reminder(self.reminder_list.currentIndex().row())
+
     def get_selected_datetime(self):
         selected_date = self.date_input.date().toPyDate()
         selected_time = self.time_input.time().toPyTime()
@@ -1058,14 +1704,12 @@ class ReminderTab(QWidget):
         if datetime_obj <= datetime.now():
             QMessageBox.warning(self, "Warning", "Masukkan waktu yang akan datang.")
             return
-        reminders.append({'title': title, 'datetime': datetime_obj})
-        self.reminder_list.addItem(f"{title} | {datetime_obj.strftime('%Y-%m-%d %H:%M:%S')}")
-        schedule_notification(title, datetime_obj)
+        store.submit("add", title, datetime_obj)
         self.title_input.clear()
 
     def edit_reminder(self):
-        selected = self.reminder_list.currentRow()
-        if selected == -1:
+        selected = self.selected_reminder()
+        if selected is None:
             QMessageBox.warning(self, "Warning", "Pilih reminder yang ingin diedit.")
             return
         title = self.title_input.text().strip()
@@ -1077,42 +1721,138 @@ class ReminderTab(QWidget):
             QMessageBox.warning(self, "Warning", "Masukkan waktu yang akan datang.")
             return
         
-        reminders[selected] = {'title': title, 'datetime': datetime_obj}
-        self.reminder_list.item(selected).setText(f"{title} | {datetime_obj.strftime('%Y-%m-%d %H:%M:%S')}")
+        store.submit("edit", selected.id, title, datetime_obj)
         QMessageBox.information(self, "Berhasil", "Reminder berhasil diperbarui.")
         self.title_input.clear()
 
     def delete_reminder(self):
-        selected = self.reminder_list.currentRow()
-        if selected == -1:
+        selected = self.selected_reminder()
+        if selected is None:
             QMessageBox.warning(self, "Warning", "Pilih reminder yang ingin dihapus.")
             return
-        # --- Tambahkan ke history sebelum dihapus ---
-        reminder = reminders[selected]
-        history.append(reminder)
-        title = reminder['title']
-        cancel_scheduled(title)
-        del reminders[selected]
-        self.reminder_list.takeItem(selected)
-    
-    def refresh_reminder_list(self):
-        self.reminder_list.clear()
-        for r in reminders:
-            self.reminder_list.addItem(f"{r['title']} | {r['datetime'].strftime('%Y-%m-%d %H:%M:%S')}")
+        # --- Store memindahkan reminder ke history ---
+        store.submit("delete", selected.id)
     
     def on_time_changed(self, new_time):
         pass
 
+def get_web_profile():
+    """Shared persistent profile for the CeLOE page, created on first use."""
+    global web_profile
+    if web_profile is None:
+        from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+        web_profile = QWebEngineProfile("celoe", QApplication.instance())
+        web_profile.setPersistentStoragePath(str(WEB_PROFILE_DIR / "storage"))
+        web_profile.setCachePath(str(WEB_CACHE_DIR))
+        web_profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        web_profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
+        web_profile.setHttpCacheMaximumSize(web_cache_mb * 1024 * 1024)
+    return web_profile
+
+def directory_usage(path):
+    """(total bytes, file count) below `path`."""
+    total = count = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+                count += 1
+            except OSError:
+                pass
+    return total, count
+
 class BrowserTab(QWidget):
+    """CeLOE page; the web view is created on first show and frozen while hidden."""
     def __init__(self):
         super().__init__()
-        layout = QVBoxLayout()
+        self.layout = QVBoxLayout()
+        self.browser = None
+        self.saved_scroll = None
+        self.freeze_timer = QTimer(self)
+        self.freeze_timer.setSingleShot(True)
+        self.freeze_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.freeze_timer.timeout.connect(self.freeze_page)
+        self.discard_timer = QTimer(self)
+        self.discard_timer.setSingleShot(True)
+        self.discard_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.discard_timer.timeout.connect(self.discard_page)
+        self.placeholder = QLabel("Memuat CeLOE...")
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.placeholder.setStyleSheet("font-size: 14px; color: #95a5a6;")
+        self.layout.addWidget(self.placeholder)
+        self.setLayout(self.layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.freeze_timer.stop()
+        self.discard_timer.stop()
+        if self.browser is None:
+            # Let the placeholder paint before the web engine spins up
+            QTimer.singleShot(0, self.create_browser)
+        else:
+            self.activate_page()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.browser is not None:
+            self.freeze_timer.start(WEB_FREEZE_AFTER)
+            self.discard_timer.start(WEB_DISCARD_AFTER)
+
+    def set_lifecycle(self, state):
+        page = self.browser.page()
+        if page.lifecycleState() == state or self.isVisible():
+            return
+        page.setLifecycleState(state)
+
+    def freeze_page(self):
+        from PyQt5.QtWebEngineWidgets import QWebEnginePage
+        self.set_lifecycle(QWebEnginePage.Frozen)
+
+    def discard_page(self):
+        from PyQt5.QtWebEngineWidgets import QWebEnginePage
+        page = self.browser.page()
+        if page.lifecycleState() != QWebEnginePage.Discarded:
+            # Discarding keeps the URL/history but not the scroll offset
+            self.saved_scroll = page.scrollPosition()
+        self.set_lifecycle(QWebEnginePage.Discarded)
+
+    def activate_page(self):
+        from PyQt5.QtWebEngineWidgets import QWebEnginePage
+        page = self.browser.page()
+        # A discarded page reloads when it becomes active again
+        page.setLifecycleState(QWebEnginePage.Active)
+
+    def release_browser(self):
+        """Delete the view and its page now, before the profile goes."""
+        if self.browser is None:
+            return
+        from PyQt5 import sip
+        self.freeze_timer.stop()
+        self.discard_timer.stop()
+        sip.delete(self.browser)
+        self.browser = None
+
+    def restore_scroll(self, ok):
+        if not ok or self.saved_scroll is None:
+            return
+        pos, self.saved_scroll = self.saved_scroll, None
+        self.browser.page().runJavaScript(f"window.scrollTo({pos.x()}, {pos.y()});")
+
+    def create_browser(self):
+        if self.browser is not None:
+            return
+        from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
         self.browser = QWebEngineView()
-        self.browser.setUrl(QUrl("https://lms.telkomuniversity.ac.id"))
-        layout.addWidget(self.browser)
-        self.setLayout(layout)
+        self.browser.setPage(QWebEnginePage(get_web_profile(), self.browser))
+        self.browser.loadFinished.connect(self.restore_scroll)
+        self.browser.setUrl(QUrl(LMS_URL))
+        self.layout.replaceWidget(self.placeholder, self.browser)
+        self.placeholder.deleteLater()
+        self.placeholder = None
 
 class CustomizeTab(QWidget):
+    cache_stats_ready = pyqtSignal(int, int)
+
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout()
@@ -1166,34 +1906,13 @@ class CustomizeTab(QWidget):
 
         # Image Preview Section
         self.image_preview = QLabel()
+        self.image_preview.setObjectName("imagePreview")
         self.image_preview.setFixedSize(300, 200)
         self.image_preview.setAlignment(Qt.AlignCenter)
-        self.image_preview.setStyleSheet("""
-            QLabel {
-                background: #f8f9fa;
-                border: 2px dashed #dee2e6;
-                border-radius: 12px;
-            }
-        """)
         
         # Image Selection Button
         self.select_image_button = QPushButton("Choose Image")
-        self.select_image_button.setStyleSheet("""
-            QPushButton {
-                background: #E74C3C;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #c0392b;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-            }
-        """)
+        self.select_image_button.setStyleSheet("padding: 12px 24px;")
         self.select_image_button.clicked.connect(self.select_custom_image)
         
         # Add selected image label
@@ -1239,42 +1958,11 @@ class CustomizeTab(QWidget):
         # Sound Controls
         sound_controls = QHBoxLayout()
         self.select_sound_button = QPushButton("Choose Sound")
-        self.select_sound_button.setStyleSheet("""
-            QPushButton {
-                background: #E74C3C;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #c0392b;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-            }
-        """)
+        self.select_sound_button.setStyleSheet("padding: 12px 24px;")
         self.select_sound_button.clicked.connect(self.select_custom_sound)
         
         self.test_sound_button = QPushButton("Test Sound")
-        self.test_sound_button.setStyleSheet("""
-            QPushButton {
-                background: #f8f9fa;
-                color: #E74C3C;
-                border: 2px solid #E74C3C;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #fee2e2;
-            }
-            QPushButton:disabled {
-                border-color: #bdc3c7;
-                color: #bdc3c7;
-            }
-        """)
+        self.test_sound_button.setObjectName("outlineButton")
         self.test_sound_button.clicked.connect(self.test_sound)
         
         sound_controls.addWidget(self.select_sound_button)
@@ -1294,6 +1982,49 @@ class CustomizeTab(QWidget):
         sound_card.setLayout(sound_layout)
         layout.addWidget(sound_card)
 
+        # Browser Cache Card
+        cache_card = QWidget()
+        cache_card.setObjectName("settingsCard")
+        cache_layout = QVBoxLayout()
+        cache_layout.setSpacing(16)
+
+        cache_header = QHBoxLayout()
+        cache_icon = QLabel("🌐")
+        cache_icon.setStyleSheet("font-size: 24px;")
+        cache_title = QLabel("CeLOE Cache")
+        cache_title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        cache_header.addWidget(cache_icon)
+        cache_header.addWidget(cache_title)
+        cache_header.addStretch()
+        cache_layout.addLayout(cache_header)
+
+        cache_controls = QHBoxLayout()
+        cache_limit_label = QLabel("Batas cache (MB)")
+        self.cache_limit_input = QSpinBox()
+        self.cache_limit_input.setRange(20, 4096)
+        self.cache_limit_input.setSingleStep(50)
+        self.cache_limit_input.setValue(web_cache_mb)
+        # Saved once editing is done, not on every step or keystroke
+        self.cache_limit_input.editingFinished.connect(self.set_cache_limit)
+        self.clear_cache_button = QPushButton("Clear Cache")
+        self.clear_cache_button.clicked.connect(self.clear_web_cache)
+        cache_controls.addWidget(cache_limit_label)
+        cache_controls.addWidget(self.cache_limit_input)
+        cache_controls.addStretch()
+        cache_controls.addWidget(self.clear_cache_button)
+        cache_layout.addLayout(cache_controls)
+
+        self.cache_stats_label = QLabel("Menghitung ukuran cache...")
+        self.cache_stats_label.setStyleSheet("""
+            color: #95a5a5;
+            font-size: 12px;
+        """)
+        cache_layout.addWidget(self.cache_stats_label)
+
+        cache_card.setLayout(cache_layout)
+        layout.addWidget(cache_card)
+        self.cache_stats_ready.connect(self.show_cache_stats)
+
         # Test Notification Card
         test_card = QWidget()
         test_card.setObjectName("settingsCard")
@@ -1342,115 +2073,6 @@ class CustomizeTab(QWidget):
         test_card.setLayout(test_layout)
         layout.addWidget(test_card)
 
-        # Add global styles
-        self.setStyleSheet("""
-            QWidget#settingsCard {
-                border-radius: 16px;
-                padding: 24px;
-                margin: 8px 0;
-            }
-            QWidget#settingsCard[darkMode="true"] {
-                background: #262626;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            QWidget#settingsCard[darkMode="false"] {
-                background: white;
-                border: 1px solid rgba(0, 0, 0, 0.1);
-            }
-            QLabel[darkMode="true"] {
-                color: #e0e0e0;
-            }
-            QLabel[darkMode="false"] {
-                color: #2c3e50;
-            }
-            QLabel#imagePreview[darkMode="true"] {
-                background: #333333;
-                border: 2px dashed #404040;
-            }
-            QLabel#imagePreview[darkMode="false"] {
-                background: #f8f9fa;
-                border: 2px dashed #dee2e6;
-            }
-        """)
-
-        # Update image preview style
-        self.image_preview.setObjectName("imagePreview")
-        
-        # Add method to update dark mode
-        def update_dark_mode(self, is_dark):
-            # Update card properties
-            for card in [image_card, sound_card]:
-                card.setProperty("darkMode", is_dark)
-                card.style().unpolish(card)
-                card.style().polish(card)
-            
-            # Update labels
-            for label in self.findChildren(QLabel):
-                label.setProperty("darkMode", is_dark)
-                label.style().unpolish(label)
-                label.style().polish(label)
-            
-            # Update preview
-            self.image_preview.setProperty("darkMode", is_dark)
-            self.image_preview.style().unpolish(self.image_preview)
-            self.image_preview.style().polish(self.image_preview)
-
-            # Update title colors
-            title.setStyleSheet(f"""
-                font-size: 28px;
-                font-weight: bold;
-                color: #E74C3C;
-            """)
-            
-            # Update subtitle colors
-            subtitle.setStyleSheet(f"""
-                font-size: 14px;
-                color: {'#95a5a6' if not is_dark else '#777777'};
-                margin-top: -4px;
-            """)
-            
-            # Update buttons
-            buttons = [self.select_image_button, self.select_sound_button]
-            for btn in buttons:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: #E74C3C;
-                        color: white;
-                        border: none;
-                        padding: 12px 24px;
-                        border-radius: 8px;
-                        font-weight: 500;
-                    }}
-                    QPushButton:hover {{
-                        background: #c0392b;
-                    }}
-                    QPushButton:disabled {{
-                        background: {'#404040' if is_dark else '#bdc3c7'};
-                    }}
-                """)
-            
-            # Update test sound button
-            self.test_sound_button.setStyleSheet(f"""
-                QPushButton {{
-                    background: {'#333333' if is_dark else '#f8f9fa'};
-                    color: #E74C3C;
-                    border: 2px solid #E74C3C;
-                    padding: 12px 24px;
-                    border-radius: 8px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    background: {'#404040' if is_dark else '#fee2e2'};
-                }}
-                QPushButton:disabled {{
-                    border-color: {'#404040' if is_dark else '#bdc3c7'};
-                    color: {'#404040' if is_dark else '#bdc3c7'};
-                }}
-            """)
-
-        # Connect to main window's dark mode toggle
-        self.update_dark_mode = update_dark_mode
-
         layout.addStretch()
         self.setLayout(layout)
                 # Reflect saved toggle states and preview
@@ -1458,9 +2080,9 @@ class CustomizeTab(QWidget):
         self.image_switch.toggle_position = 1 if use_custom_image else 0
         self.image_switch.update()
         
+        rendition_cache.ready.connect(self.on_rendition_ready)
         if selected_image and os.path.exists(selected_image):
-            pixmap = QPixmap(selected_image)
-            self.image_preview.setPixmap(pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.show_preview(selected_image)
             self.selected_image_label.setText(f"Terpilih: {os.path.basename(selected_image)}")
         
         self.select_sound_button.setEnabled(use_custom_sound)
@@ -1470,31 +2092,66 @@ class CustomizeTab(QWidget):
         
         if selected_sound and os.path.exists(selected_sound):
             self.selected_sound_label.setText(f"Terpilih: {os.path.basename(selected_sound)}")
-        
-        
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_cache_stats()
+
+    def refresh_cache_stats(self):
+        # Walking the cache directory can take a moment; keep it off the GUI thread
+        def measure():
+            self.cache_stats_ready.emit(*directory_usage(WEB_CACHE_DIR))
+        threading.Thread(target=measure, daemon=True).start()
+
+    def show_cache_stats(self, total, count):
+        self.cache_stats_label.setText(
+            f"Terpakai {total / (1024 * 1024):.1f} MB dari {web_cache_mb} MB ({count} file)")
+
+    def set_cache_limit(self):
+        global web_cache_mb
+        value = self.cache_limit_input.value()
+        if value == web_cache_mb:
+            return
+        web_cache_mb = value
+        if web_profile is not None:
+            web_profile.setHttpCacheMaximumSize(value * 1024 * 1024)
+        record_settings()
+        self.refresh_cache_stats()
+
+    def clear_web_cache(self):
+        if web_profile is not None:
+            web_profile.clearHttpCache()
+        else:
+            shutil.rmtree(WEB_CACHE_DIR, ignore_errors=True)
+        # clearHttpCache runs asynchronously; measure again shortly after
+        QTimer.singleShot(1000, self.refresh_cache_stats)
+
     def paint_switch(self, event, switch):
         painter = QPainter(switch)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        painter.setPen(Qt.NoPen)
-        if switch.toggle_position == 1:
-            painter.setBrush(QColor("#E74C3C"))
-        else:
-            painter.setBrush(QColor("#bdc3c7"))
-        painter.drawRoundedRect(0, 0, 52, 26, 13, 13)
+        on = switch.toggle_position == 1
+        track = cached_layer(("switch", on), 52, 26, switch.devicePixelRatioF(),
+                             lambda p: self.draw_switch_track(p, on))
+        painter.drawPixmap(0, 0, track)
         
         # Draw toggle circle
+        painter.setPen(Qt.NoPen)
         painter.setBrush(QColor("white"))
         x = 4 + (switch.toggle_position * 26)
         painter.drawEllipse(int(x), 4, 18, 18)
 
+    def draw_switch_track(self, painter, on):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#E74C3C" if on else "#bdc3c7"))
+        painter.drawRoundedRect(0, 0, 52, 26, 13, 13)
+
     def toggle_image(self):
         global use_custom_image
         use_custom_image = not use_custom_image
         self.image_switch.toggle_position = 1 if use_custom_image else 0
         self.select_image_button.setEnabled(use_custom_image)
         self.image_switch.update()
+        record_settings()
 
     def toggle_sound(self):
         global use_custom_sound
@@ -1503,6 +2160,7 @@ class CustomizeTab(QWidget):
         self.select_sound_button.setEnabled(use_custom_sound)
         self.test_sound_button.setEnabled(use_custom_sound and selected_sound is not None)
         self.sound_switch.update()
+        record_settings()
 
     def select_custom_image(self):
         global selected_image
@@ -1526,11 +2184,26 @@ class CustomizeTab(QWidget):
                     return
                 
             self.selected_image_label.setText(f"Terpilih: {os.path.basename(selected_image)}")
-            pixmap = QPixmap(selected_image)
-            self.image_preview.setPixmap(pixmap.scaled(180, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            rendition_cache.prepare(selected_image)
+            self.show_preview(selected_image)
+            record_settings()
+
+    def show_preview(self, path):
+        pixmap = rendition_cache.pixmap(path, PREVIEW_SIZE, PREVIEW_SIZE, self.devicePixelRatioF())
+        if pixmap is None:
+            # Rendered in the background; on_rendition_ready fills it in
+            self.image_preview.clear()
+            self.image_preview.setText("Memuat pratinjau...")
+        else:
+            self.image_preview.setPixmap(pixmap)
+
+    def on_rendition_ready(self, path, rendition):
+        if path == selected_image and self.image_preview.pixmap() is None:
+            self.show_preview(path)
     
     def select_custom_sound(self):
         global selected_sound
+        previous_sound = selected_sound
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getOpenFileName(
             self, "Pilih Suara", "", "Sound Files (*.mp3 *.wav)"
@@ -1552,17 +2225,20 @@ class CustomizeTab(QWidget):
                 
             self.selected_sound_label.setText(f"Terpilih: {os.path.basename(selected_sound)}")
             self.test_sound_button.setEnabled(True)
+            if previous_sound:
+                sound_cache.discard(previous_sound)
+            sound_cache.preload([selected_sound])
+            record_settings()
     
     def test_sound(self):
         if selected_sound and os.path.exists(selected_sound):
             try:
-                pygame.mixer.music.load(selected_sound)
-                pygame.mixer.music.play()
+                play_sound(selected_sound)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to play sound: {e}")
     
     def preview_reminder(self):
-        notification.notify(
+        notify(
             title="Test Notification",
             message="Testing your current notification settings",
             timeout=10
@@ -1571,12 +2247,11 @@ class CustomizeTab(QWidget):
         # Test sound
         if use_custom_sound and selected_sound:
             try:
-                pygame.mixer.music.load(selected_sound)
-                pygame.mixer.music.play()
+                play_sound(selected_sound)
             except Exception as e:
                 print(f"Error playing sound: {e}")
         else:
-            play_alarm()
+            play_alarm("preview")
         
         # Test image
         if use_custom_image and selected_image:
@@ -1590,6 +2265,84 @@ class CustomizeTab(QWidget):
         use_custom_sound = self.custom_sound_radio.isChecked()
         QMessageBox.information(self, "Success", "Settings saved successfully!")
 
+class HistoryListModel(QAbstractListModel):
+    """Newest-first history model, fetched in pages as the view scrolls."""
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # fetched entries, newest first
+        self._active = False
+        self._query = None
+        store.history_appended.connect(self.on_history_appended)
+        store.history_search_changed.connect(self.on_history_search_changed)
+
+    def activate(self):
+        if self._active:
+            return
+        self._active = True
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return format_reminder(self._rows[index.row()])
+
+    def set_filter(self, text, start=None, end=None):
+        self._query = (text, start, end)
+        self._apply_filter()
+
+    def _apply_filter(self):
+        results = store.search_history(*self._query) if self._query else None
+        self.beginResetModel()
+        if results is None:
+            # Back to paged browsing from the newest entry
+            self._query = None
+            self._rows = []
+        else:
+            self._rows = results[::-1]
+        self.endResetModel()
+        if results is None and self.canFetchMore():
+            self.fetchMore()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._active or self._query:
+            return False
+        return len(self._rows) < len(store.history) or store.history.has_older()
+
+    def fetchMore(self, parent=QModelIndex()):
+        history = store.history
+        remaining = len(history) - len(self._rows)
+        if remaining <= 0:
+            store.load_older_history()
+            remaining = len(history) - len(self._rows)
+            if remaining <= 0:
+                return
+        count = min(self.PAGE_SIZE, remaining)
+        # History pages are oldest first; the rows already shown are its tail
+        batch = history.page(remaining - count, count)
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(batch) - 1)
+        self._rows.extend(reversed(batch))
+        self.endInsertRows()
+
+    def on_history_search_changed(self):
+        if self._query:
+            self._apply_filter()
+
+    def on_history_appended(self, reminder):
+        if not self._active:
+            return
+        if self._query:
+            self._apply_filter()
+            return
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, reminder)
+        self.endInsertRows()
+
 class HistoryTab(QWidget):
     def __init__(self):
         super().__init__()
@@ -1603,52 +2356,275 @@ class HistoryTab(QWidget):
         title_label.setStyleSheet("font-size: 20px; font-weight: bold; margin-bottom: 8px;")
         self.layout.addWidget(title_label)
 
-        self.history_list = QListWidget()
+        self.search_bar = SearchBar("Cari riwayat...")
+        self.layout.addWidget(self.search_bar)
+
+        # --- Terbaru di atas, halaman lama dimuat saat di-scroll ---
+        self.history_model = HistoryListModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
+        self.search_bar.changed.connect(self.on_search_changed)
         self.history_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #bbb;
                 border-radius: 8px;
                 padding: 8px;
                 font-size: 15px;
                 min-height: 180px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: #fde8e7;
                 color: #E74C3C;
             }
         """)
         self.layout.addWidget(self.history_list)
         self.setLayout(self.layout)
-        self.refresh_history()
 
-    def refresh_history(self):
-        self.history_list.clear()
-        # --- Tampilkan semua history, baik yang lewat maupun dihapus ---
-        for r in history:
-            self.history_list.addItem(f"{r['title']} | {r['datetime'].strftime('%Y-%m-%d %H:%M:%S')}")
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.history_model.activate()
+
+    def on_search_changed(self, text, start, end):
+        self.history_model.activate()
+        self.history_model.set_filter(text, start, end)
+
+mixer_lock = threading.Lock()  # decoding threads may be first to touch the mixer
+
+def ensure_mixer():
+    """pygame.mixer, imported and initialised on first use."""
+    import pygame
+    with mixer_lock:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    return pygame.mixer
+
+def notify(title, message, timeout=10):
+    # plyer picks its platform backend on import; defer that to the first notification
+    from plyer import notification
+    notification.notify(title=title, message=message, timeout=timeout)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+SOUND_EXTENSIONS = ('.mp3', '.wav')
+
+class AssetCatalog(QObject):
+    """Watched file lists of the image and alarm folders."""
+    FOLDERS = {
+        "chara": (CHAR_IMG_PATH, IMAGE_EXTENSIONS),
+        "alarm": (ALARM_SOUND_PATH, SOUND_EXTENSIONS),
+        "alarm1": (ALARM_1H_PATH, SOUND_EXTENSIONS),
+        "alarm24": (ALARM_24H_PATH, SOUND_EXTENSIONS),
+    }
+    SOUND_KINDS = ("alarm", "alarm1", "alarm24")
+    changed = pyqtSignal(str, list, list)
+
+    def __init__(self):
+        super().__init__()
+        self.assets = {}
+        self.kinds_by_dir = {}
+        self.watcher = QFileSystemWatcher(self)
+        for kind, (folder, _) in self.FOLDERS.items():
+            self.kinds_by_dir[os.path.normpath(str(folder))] = kind
+            self.scan(kind)
+            if folder.exists():
+                self.watcher.addPath(str(folder))
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+
+    def folder(self, kind):
+        return self.FOLDERS[kind][0]
+
+    def scan(self, kind):
+        folder, extensions = self.FOLDERS[kind]
+        files = []
+        if folder.exists():
+            files = sorted(os.path.join(folder, f) for f in os.listdir(folder)
+                           if f.lower().endswith(extensions))
+        # Swap in a new tuple so other threads only ever see a complete list
+        self.assets[kind] = tuple(files)
+
+    def on_directory_changed(self, path):
+        kind = self.kinds_by_dir.get(os.path.normpath(path))
+        if kind is not None:
+            before = set(self.assets[kind])
+            self.scan(kind)
+            after = set(self.assets[kind])
+            if before != after:
+                self.changed.emit(kind, sorted(after - before), sorted(before - after))
+
+    def paths(self, kind):
+        return self.assets[kind]
+
+    def pick(self, kind):
+        files = self.assets[kind]
+        return random.choice(files) if files else None
+
+class SoundCache:
+    """LRU cache of decoded pygame Sounds, keyed by path, size and mtime."""
+    BUDGET = 64 * 1024 * 1024
+
+    def __init__(self, budget=BUDGET):
+        self.budget = budget
+        self.sounds = OrderedDict()  # key -> (Sound, nbytes)
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def _key(self, path):
+        st = os.stat(path)
+        return (str(path), st.st_size, st.st_mtime_ns)
+
+    def cached(self, path):
+        """The decoded Sound if it is already cached, else None."""
+        key = self._key(path)
+        with self.lock:
+            entry = self.sounds.get(key)
+            if entry is None:
+                return None
+            self.sounds.move_to_end(key)
+            return entry[0]
+
+    def get(self, path):
+        sound = self.cached(path)
+        if sound is not None:
+            return sound
+        # Decode outside the lock so cached clips stay playable meanwhile
+        key = self._key(path)
+        mixer = ensure_mixer()
+        sound = mixer.Sound(str(path))
+        frequency, size, channels = mixer.get_init()
+        nbytes = int(sound.get_length() * frequency * channels * abs(size) // 8)
+        with self.lock:
+            if key in self.sounds:
+                return self.sounds[key][0]
+            if nbytes <= self.budget:
+                self.sounds[key] = (sound, nbytes)
+                self.used += nbytes
+                while self.used > self.budget:
+                    _, (_, dropped) = self.sounds.popitem(last=False)
+                    self.used -= dropped
+            return sound
+
+    def discard(self, path):
+        with self.lock:
+            for key in [k for k in self.sounds if k[0] == str(path)]:
+                self.used -= self.sounds.pop(key)[1]
+
+    def preload(self, paths):
+        """Decode `paths` in a background thread."""
+        def decode():
+            for path in paths:
+                try:
+                    if path and os.path.exists(path):
+                        self.get(path)
+                except Exception as e:
+                    print(f"Error decoding sound {path}: {e}")
+        threading.Thread(target=decode, daemon=True).start()
+
+    def on_assets_changed(self, kind, added, removed):
+        if kind not in AssetCatalog.SOUND_KINDS:
+            return
+        for path in removed:
+            self.discard(path)
+        self.preload(added)
+
+    def warm_up(self):
+        paths = [p for kind in AssetCatalog.SOUND_KINDS for p in asset_catalog.paths(kind)]
+        if use_custom_sound and selected_sound:
+            paths.insert(0, selected_sound)
+        self.preload(paths)
+
+class AlarmMixer(QObject):
+    """Plays alarms on two channels, ranked due > 1h > 24h > preview."""
+    PRIORITY = {"regular": 3, "1h": 2, "24h": 1, "preview": 0}
+    DUCK_VOLUME = 0.25
+    MAX_QUEUE = 8
+    requested = pyqtSignal(int, object)
+
+    def __init__(self):
+        super().__init__()
+        self.channels = None
+        self.playing = {}  # channel index -> priority
+        self.queue = []  # heap of (-priority, seq, sound)
+        self.seq = itertools.count()
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(100)
+        self.poll_timer.timeout.connect(self._poll)
+        self.requested.connect(self._request)
+
+    def play(self, kind, path):
+        priority = self.PRIORITY.get(kind, 0)
+        sound = sound_cache.cached(path)
+        if sound is not None:
+            self.requested.emit(priority, sound)
+            return
+
+        def decode():
+            try:
+                self.requested.emit(priority, sound_cache.get(path))
+            except Exception as e:
+                print(f"Error playing sound: {e}")
+        threading.Thread(target=decode, daemon=True).start()
+
+    def _request(self, priority, sound):
+        if self.channels is None:
+            mixer = ensure_mixer()
+            mixer.set_reserved(2)
+            self.channels = [mixer.Channel(0), mixer.Channel(1)]
+        self._poll()
+        free = [i for i in range(2) if i not in self.playing]
+        if free and (not self.playing or priority > max(self.playing.values())):
+            self._start(free[0], priority, sound)
+        elif len(self.queue) < self.MAX_QUEUE:
+            heapq.heappush(self.queue, (-priority, next(self.seq), sound))
+        self.poll_timer.start()
+
+    def _start(self, index, priority, sound):
+        self.channels[index].play(sound)
+        self.playing[index] = priority
+        self._balance()
+
+    def _balance(self):
+        # Only the highest-ranked sound plays at full volume
+        if not self.playing:
+            return
+        top = max(self.playing, key=self.playing.get)
+        for index in self.playing:
+            self.channels[index].set_volume(1.0 if index == top else self.DUCK_VOLUME)
+
+    def _poll(self):
+        if self.channels is None:
+            return
+        for index in [i for i in self.playing if not self.channels[i].get_busy()]:
+            del self.playing[index]
+        while self.queue:
+            free = [i for i in range(2) if i not in self.playing]
+            priority = -self.queue[0][0]
+            if not free or (self.playing and priority <= max(self.playing.values())):
+                break
+            _, _, sound = heapq.heappop(self.queue)
+            self._start(free[0], priority, sound)
+        self._balance()
+        if not self.playing and not self.queue:
+            self.poll_timer.stop()
+
+def play_sound(path, kind="preview"):
+    alarm_mixer.play(kind, path)
 
 def play_alarm(alarm_type="regular"):
     try:
         if use_custom_sound and selected_sound and os.path.exists(selected_sound):
-            pygame.mixer.music.load(selected_sound)
-            pygame.mixer.music.play()
+            play_sound(selected_sound, alarm_type)
             return
         if alarm_type == "24h":
-            sound_folder = ALARM_24H_PATH
+            kind = "alarm24"
         elif alarm_type == "1h":
-            sound_folder = ALARM_1H_PATH
-        else:  # regular
-            sound_folder = ALARM_SOUND_PATH
-        sounds = []
-        if sound_folder.exists():
-            sounds = [os.path.join(sound_folder, f) for f in os.listdir(sound_folder)
-                     if f.endswith(".mp3") or f.endswith(".wav")]
-        if not sounds:
-            print(f"No {alarm_type} alarm sounds found in {sound_folder}")
+            kind = "alarm1"
+        else:  # regular, preview
+            kind = "alarm"
+        sound_file = asset_catalog.pick(kind)
+        if sound_file is None:
+            print(f"No {alarm_type} alarm sounds found in {asset_catalog.folder(kind)}")
             return
-        sound_file = random.choice(sounds)
-        pygame.mixer.music.load(sound_file)
-        pygame.mixer.music.play()
+        play_sound(sound_file, alarm_type)
     except Exception as e:
         print(f"Error playing sound: {e}")
 
@@ -1658,57 +2634,206 @@ def show_image():
         if use_custom_image and selected_image and os.path.exists(selected_image):
             popup_manager.show_image_signal.emit(selected_image)
         else:
-            images = [os.path.join(CHAR_IMG_PATH, f) for f in os.listdir(CHAR_IMG_PATH)
-                    if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'))]
-            if not images:
+            image_file = asset_catalog.pick("chara")
+            if image_file is None:
                 print("No character images found.")
                 return
-            image_file = random.choice(images)
             popup_manager.show_image_signal.emit(image_file)
     except Exception as e:
         print(f"Error showing image: {e}")
 
-def schedule_notification(title, dt):
-    def notify():
-        notification.notify(title="Reminder", message=title, timeout=10)
-        play_alarm("regular")
-        show_image()
-        
-    def notify_24h():
-        notification.notify(title="Upcoming Reminder (24h)", message=f"{title} in 24 hours", timeout=10)
-        play_alarm("24h")
-        show_image()
-        
-    def notify_1h():
-        notification.notify(title="Upcoming Reminder (1h)", message=f"{title} in 1 hour", timeout=10)
-        play_alarm("1h")
-        show_image()
-
-    early_24h_time = dt - timedelta(hours=24)
-    early_1h_time = dt - timedelta(hours=1)
-    
-    if early_24h_time > datetime.now():
-        schedule.every(1).seconds.do(lambda: check_time(early_24h_time, notify_24h)).tag(title + "_24h")
-    
-    if early_1h_time > datetime.now():
-        schedule.every(1).seconds.do(lambda: check_time(early_1h_time, notify_1h)).tag(title + "_1h")
-    
-    schedule.every(1).seconds.do(lambda: check_time(dt, notify)).tag(title)
-
-def cancel_scheduled(title):
-    schedule.clear(title)
-    schedule.clear(title + "_24h")
-    schedule.clear(title + "_1h")
+# Early warnings as seconds before the deadline -> alert kind
+LEAD_KINDS = {24 * 3600: "24h", 3600: "1h"}
+DEFAULT_LEADS = (24 * 3600, 3600)
+
+# Reminder.flags, set when a reminder moves to history
+REMINDER_DELETED = 1
+REMINDER_EXPIRED = 2
+
+class DeadlineScheduler(ABC):
+    """Min-heap of (fire_time, reminder_id, kind) entries with lazy cancellation."""
+    # Upper bound for one sleep, so a suspended laptop notices missed deadlines
+    MAX_SLEEP = 60
+
+    def __init__(self, callback):
+        self.callback = callback
+        self._heap = []
+        self._entries = {}  # reminder_id -> live heap entries
+        self._counter = itertools.count()
+        self._dead = 0
+        self._lock = threading.RLock()
+
+    def schedule(self, reminder_id, kind, fire_time):
+        # [fire_time (epoch s), seq, reminder_id, kind, alive]; seq keeps ties ordered
+        entry = [fire_time, next(self._counter), reminder_id, kind, True]
+        with self._lock:
+            heapq.heappush(self._heap, entry)
+            self._entries.setdefault(reminder_id, []).append(entry)
+            if self._heap[0] is entry:
+                self._wake()
+
+    def cancel(self, reminder_id):
+        with self._lock:
+            for entry in self._entries.pop(reminder_id, ()):
+                entry[4] = False
+                self._dead += 1
+            # Rebuild once dead entries dominate so the heap doesn't bloat
+            if self._dead > 64 and self._dead * 2 > len(self._heap):
+                self._heap = [e for e in self._heap if e[4]]
+                heapq.heapify(self._heap)
+                self._dead = 0
+
+    def _pop_due(self, now):
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not entry[4]:
+                self._dead -= 1
+                continue
+            reminder_id, kind = entry[2], entry[3]
+            pending = self._entries.get(reminder_id)
+            if pending is not None:
+                pending.remove(entry)
+                if not pending:
+                    del self._entries[reminder_id]
+            due.append((reminder_id, kind))
+        return due
+
+    def _next_timeout(self, now):
+        if not self._heap:
+            return self.MAX_SLEEP
+        return min(max(self._heap[0][0] - now, 0), self.MAX_SLEEP)
+
+    def _fire(self, due):
+        for reminder_id, kind in due:
+            try:
+                self.callback(reminder_id, kind)
+            except Exception as e:
+                print(f"Error firing reminder: {e}")
 
-def check_time(target_time, callback):
-    if datetime.now() >= target_time:
-        callback()
-        return schedule.CancelJob
+    def _wake(self):
+        pass
 
-def run_scheduler():
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+    @abstractmethod
+    def start(self):
+        """Begin serving the heap."""
+
+class ThreadScheduler(DeadlineScheduler):
+    """Serves the heap from a daemon thread blocked on a condition variable."""
+    def __init__(self, callback):
+        super().__init__(callback)
+        self._cond = threading.Condition(self._lock)
+
+    def _wake(self):
+        self._cond.notify()
+
+    def run(self):
+        while True:
+            with self._cond:
+                due = self._pop_due(time.time())
+                if not due:
+                    self._cond.wait(self._next_timeout(time.time()))
+                    continue
+            self._fire(due)
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+
+class QtTimerScheduler(DeadlineScheduler):
+    """Single-shot QTimer over the heap; schedule/cancel only from the GUI thread."""
+    def __init__(self, callback):
+        super().__init__(callback)
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.VeryCoarseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+        self._started = False
+
+    def _wake(self):
+        if self._started:
+            self._rearm()
+
+    def _rearm(self):
+        # VeryCoarseTimer works in whole seconds; round up so it never re-arms at 0
+        self._timer.start(math.ceil(self._next_timeout(time.time())) * 1000)
+
+    def _on_timeout(self):
+        with self._lock:
+            # The timer may fire up to a second early; that counts as due
+            due = self._pop_due(time.time() + 1)
+        self._fire(due)
+        self._rearm()
+
+    def start(self):
+        self._started = True
+        self._rearm()
+
+SCHEDULER_BACKENDS = {
+    "qt": QtTimerScheduler,
+    "thread": ThreadScheduler,
+}
+
+def get_option(name, default=None):
+    """Read a `--name=value` command-line option."""
+    prefix = f"--{name}="
+    for arg in sys.argv[1:]:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+class Reminder:
+    """Immutable reminder with its deadline as epoch seconds."""
+    __slots__ = ("id", "title", "due", "leads", "flags")
+
+    def __init__(self, title, due, reminder_id=None, leads=DEFAULT_LEADS, flags=0):
+        self.id = reminder_id or uuid.uuid4().hex
+        self.title = title
+        self.due = due
+        self.leads = leads
+        self.flags = flags
+
+    @classmethod
+    def from_datetime(cls, title, dt, reminder_id=None, flags=0):
+        return cls(title, int(dt.timestamp()), reminder_id, flags=flags)
+
+    @property
+    def datetime(self):
+        return datetime.fromtimestamp(self.due)
+
+    def closed(self, op):
+        """Copy flagged with how it left the pending list ("delete" or "expire")."""
+        flag = REMINDER_DELETED if op == "delete" else REMINDER_EXPIRED
+        return Reminder(self.title, self.due, self.id, self.leads, self.flags | flag)
+
+def fire_reminder(reminder_id, kind):
+    reminder = store.get(reminder_id)
+    if reminder is None:
+        return
+    title, due = reminder.title, reminder.due
+    if kind == "24h":
+        notify(title="Upcoming Reminder (24h)", message=f"{title} in 24 hours", timeout=10)
+        play_alarm("24h")
+    elif kind == "1h":
+        notify(title="Upcoming Reminder (1h)", message=f"{title} in 1 hour", timeout=10)
+        play_alarm("1h")
+    else:
+        notify(title="Reminder", message=title, timeout=10)
+        play_alarm("regular")
+    show_image()
+    if kind == "due":
+        store.submit("expire", reminder_id, due)
+
+def schedule_notification(reminder):
+    now = time.time()
+    for lead in reminder.leads:
+        # Early warnings only if still ahead
+        if reminder.due - lead > now:
+            scheduler.schedule(reminder.id, LEAD_KINDS[lead], reminder.due - lead)
+    # Past due times still fire once
+    scheduler.schedule(reminder.id, "due", reminder.due)
+
+def cancel_scheduled(reminder_id):
+    scheduler.cancel(reminder_id)
 
 def create_system_tray(app, window):
     tray_icon = QSystemTrayIcon(QIcon(str(ICON_PATH)), app)
@@ -1718,22 +2843,22 @@ def create_system_tray(app, window):
     # CeLOE Submenu
     celoe_menu = tray_menu.addMenu("CeLOE")
     celoe_action = celoe_menu.addAction("Open Browser")
-    celoe_action.triggered.connect(lambda: window.show_page(window.celoe_tab, 0))
+    celoe_action.triggered.connect(lambda: window.show_page(0))
     celoe_action.triggered.connect(window.show)
 
     # Reminder Submenu
     reminder_menu = tray_menu.addMenu("Reminder")
     reminder_list_action = reminder_menu.addAction("Reminder List")
-    reminder_list_action.triggered.connect(lambda: window.show_page(window.reminder_tab, 1))
+    reminder_list_action.triggered.connect(lambda: window.show_page(1))
     reminder_list_action.triggered.connect(window.show)
 
     history_action = reminder_menu.addAction("History")
-    history_action.triggered.connect(lambda: window.show_page(window.history_tab, 2))
+    history_action.triggered.connect(lambda: window.show_page(2))
     history_action.triggered.connect(window.show)
 
     # Customize
     customize_action = tray_menu.addAction("Customize")
-    customize_action.triggered.connect(lambda: window.show_page(window.customize_tab, 3))
+    customize_action.triggered.connect(lambda: window.show_page(3))
     customize_action.triggered.connect(window.show)
 
     tray_menu.addSeparator()
@@ -1747,82 +2872,609 @@ def create_system_tray(app, window):
     return tray_icon
 
 def show_reminders_notification():
-    reminder_text = "\n".join([f"{r['title']} - {r['datetime'].strftime('%Y-%m-%d %H:%M')}" for r in reminders]) or "No reminders set."
-    notification.notify(title="Reminder List", message=reminder_text, timeout=10)
-
-def auto_delete_old_reminders(window):
-    while True:
-        now = datetime.now()
-        to_delete = []
-        for i, r in enumerate(reminders):
-            if r['datetime'] < now:
-                to_delete.append(i)
-        for i in reversed(to_delete):
-            # --- Tambahkan ke history sebelum dihapus ---
-            history.append(reminders[i])
-            del reminders[i]
-            window.reminder_tab.reminder_list.takeItem(i)
-        time.sleep(5)
-def save_config():
-    config = {
-        "reminders": [
-            {"title": r["title"], "datetime": r["datetime"].isoformat()}
-            for r in reminders
-        ],
-        "history": [
-            {"title": r["title"], "datetime": r["datetime"].isoformat()}
-            for r in history
-        ],
+    # Soonest deadline first, straight from the store's deadline column
+    upcoming = [store.get(i) for i in store.due_between(0, 2 ** 63 - 1)]
+    reminder_text = "\n".join([f"{r.title} - {r.datetime.strftime('%Y-%m-%d %H:%M')}" for r in upcoming]) or "No reminders set."
+    notify(title="Reminder List", message=reminder_text, timeout=10)
+
+def reminder_to_json(r):
+    d = {"id": r.id, "title": r.title, "datetime": r.datetime.isoformat()}
+    if r.flags:
+        d["flags"] = r.flags
+    return d
+
+def reminder_from_json(d):
+    # Older configs have no ids; ReminderJournal.load saves the generated ones right away
+    dt = datetime.fromisoformat(d["datetime"])
+    return Reminder.from_datetime(d["title"], dt, d.get("id"), d.get("flags", 0))
+
+def default_settings():
+    return {
+        "use_custom_image": False,
+        "use_custom_sound": False,
+        "selected_image": None,
+        "selected_sound": None,
+        "dark_mode": False,
+        "history_retention_months": 6,
+        "web_cache_mb": 200,
+    }
+
+def current_settings():
+    return {
         "use_custom_image": use_custom_image,
         "use_custom_sound": use_custom_sound,
         "selected_image": selected_image,
         "selected_sound": selected_sound,
-        "dark_mode": window.dark_mode
+        "dark_mode": dark_mode,
+        "history_retention_months": history_retention_months,
+        "web_cache_mb": web_cache_mb,
     }
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+
+def record_settings():
+    if storage is not None:
+        storage.append({"op": "settings", **current_settings()})
+
+def snapshot_state():
+    # Records are immutable, so shallow copies are a consistent snapshot
+    return list(store.reminders), current_settings()
+
+def history_month(reminder):
+    return time.strftime("%Y-%m", time.localtime(reminder.due))
+
+def retention_cutoff(months):
+    """Oldest month ("YYYY-MM") that is still kept hot."""
+    today = datetime.now()
+    index = today.year * 12 + today.month - 1 - months
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+def parse_history_lines(lines):
+    """Reminders from JSONL lines; a line torn by a crash is skipped."""
+    entries = []
+    for line in lines:
+        try:
+            entries.append(reminder_from_json(json.loads(line)))
+        except (ValueError, KeyError, TypeError):
+            continue
+    return entries
+
+def write_history_partitions(entries, path=HISTORY_DIR):
+    by_month = {}
+    for r in entries:
+        by_month.setdefault(history_month(r), []).append(json.dumps(reminder_to_json(r)) + "\n")
+    for month, lines in by_month.items():
+        partition = Path(path) / f"{month}.jsonl"
+        with open(partition, "ab+") as f:
+            # Start on a fresh line if a crash left the last one unterminated
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines.insert(0, "\n")
+            f.write("".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+class HistorySegments:
+    """Compressed monthly history segments (archive/YYYY-MM.jsonl.gz)."""
+    def __init__(self, path=HISTORY_ARCHIVE_DIR):
+        self.path = Path(path)
+
+    def months(self):
+        return sorted(p.name[:7] for p in self.path.glob("*.jsonl.gz"))
+
+    def write(self, month, entries):
+        # gzip members concatenate, so archiving more of a month just appends
+        with gzip.open(self.path / f"{month}.jsonl.gz", "at", encoding="utf-8") as f:
+            for r in entries:
+                f.write(json.dumps(reminder_to_json(r)) + "\n")
+
+    def read(self, month):
+        entries = []
+        try:
+            with gzip.open(self.path / f"{month}.jsonl.gz", "rt", encoding="utf-8") as f:
+                for line in f:
+                    entries.extend(parse_history_lines([line]))
+        except (EOFError, OSError, zlib.error) as e:
+            # Keep what was readable from a truncated segment
+            print(f"History segment {month} is damaged: {e}")
+        return entries
+
+class HistoryArchive:
+    """JSON-backend history in monthly partitions, loaded lazily."""
+    def __init__(self, retention_months, path=HISTORY_DIR):
+        self.path = Path(path)
+        self.retention_months = retention_months
+        self.segments = HistorySegments()
+        self.entries = []  # loaded entries, oldest first
+        self._cold = []  # archived months not loaded yet, oldest first
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._archive_expired(retention_cutoff(self.retention_months))
+            self._cold = self.segments.months()
+            self._load_hot()
+            self._loaded = True
+
+    def warm_up(self):
+        threading.Thread(target=self._ensure_loaded, daemon=True).start()
+
+    def _archive_expired(self, cutoff):
+        for partition in sorted(self.path.glob("*.jsonl")):
+            if partition.stem < cutoff:
+                self.segments.write(partition.stem, self._read(partition))
+                partition.unlink()
+
+    def _read(self, partition):
+        with open(partition, "r", encoding="utf-8", errors="replace") as f:
+            return parse_history_lines(f)
+
+    def _load_hot(self):
+        for partition in sorted(self.path.glob("*.jsonl")):
+            self.entries.extend(self._read(partition))
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self.entries)
+
+    def __iter__(self):
+        self._ensure_loaded()
+        return iter(self.entries)
+
+    def page(self, offset, limit):
+        self._ensure_loaded()
+        return self.entries[offset:offset + limit]
+
+    def append(self, reminder):
+        with self._lock:
+            write_history_partitions([reminder], self.path)
+            if self._loaded:
+                self.entries.append(reminder)
+
+    def has_older(self):
+        self._ensure_loaded()
+        return bool(self._cold)
+
+    def cold_months(self):
+        self._ensure_loaded()
+        return list(self._cold)
+
+    def load_older(self):
+        """Load the newest archived month that isn't loaded yet; returns its entries."""
+        self._ensure_loaded()
+        if not self._cold:
+            return []
+        older = self.segments.read(self._cold.pop())
+        self.entries[0:0] = older
+        return older
+
+def apply_journal_record(record, reminders, history, settings):
+    """Replay one journal record onto `reminders` (id -> record), `history` and `settings`."""
+    op = record.get("op")
+    if op in ("add", "edit"):
+        reminders[record["id"]] = reminder_from_json(record)
+    elif op in ("delete", "expire"):
+        # Missing ids were already folded into the snapshot; skip them.
+        # Records written before history partitions still need archiving.
+        reminder = reminders.pop(record["id"], None)
+        if reminder is not None and not record.get("archived"):
+            history.append(reminder.closed(op))
+    elif op == "settings":
+        settings.update({k: v for k, v in record.items() if k in settings})
+
+class ReminderJournal:
+    """Append-only journal replayed over the config.json snapshot."""
+    COMPACT_BYTES = 64 * 1024
+
+    def __init__(self, path=JOURNAL_FILE, snapshot_path=CONFIG_FILE):
+        self.path = Path(path)
+        self.snapshot_path = Path(snapshot_path)
+        self.seq = 0
+        self._file = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._damaged = False
+
+    def load(self):
+        config = {}
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r") as f:
+                config = json.load(f)
+        if "history" in config:
+            # Older snapshots kept the whole history inline; move it out once
+            write_history_partitions(reminder_from_json(r) for r in config.pop("history"))
+            self._write_json(config)
+        reminders = {}
+        for r in config.get("reminders", []):
+            reminder = reminder_from_json(r)
+            reminders[reminder.id] = reminder
+        if any("id" not in r for r in config.get("reminders", [])):
+            # Persist the generated ids before any journal record refers to them
+            config["reminders"] = [reminder_to_json(r) for r in reminders.values()]
+            self._write_json(config)
+        settings = default_settings()
+        settings.update({k: config[k] for k in settings if k in config})
+        snapshot_seq = config.get("journal_seq", 0)
+        self.seq = snapshot_seq
+        legacy_history = []
+        records = self.read()
+        if self._damaged:
+            # Drop torn lines now so the next append starts on a clean line
+            self._rewrite(records)
+        for record in records:
+            if record.get("seq", 0) > snapshot_seq:
+                apply_journal_record(record, reminders, legacy_history, settings)
+        if legacy_history:
+            write_history_partitions(legacy_history)
+            # Mark them migrated so the next start doesn't archive them again
+            for record in records:
+                if record.get("op") in ("delete", "expire"):
+                    record["archived"] = True
+            self._rewrite(records)
+        history = HistoryArchive(settings["history_retention_months"])
+        return list(reminders.values()), history, settings
+
+    def read(self):
+        """Parsed records; torn lines are skipped and flag `_damaged`."""
+        records = []
+        self._damaged = False
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        records.append(json.loads(line))
+                    except ValueError:
+                        self._damaged = True
+        if records:
+            self.seq = max(self.seq, records[-1].get("seq", 0))
+        return records
+
+    def append(self, record):
+        with self._lock:
+            self.seq += 1
+            record["seq"] = self.seq
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            size = self._file.tell()
+        if size > self.COMPACT_BYTES:
+            self.compact()
+
+    def compact(self, wait=False):
+        if self._thread is not None and self._thread.is_alive():
+            if not wait:
+                return
+            self._thread.join()
+        with self._lock:
+            seq = self.seq
+        state = snapshot_state()
+        if wait:
+            self._write_snapshot(state, seq)
+        else:
+            self._thread = threading.Thread(target=self._write_snapshot, args=(state, seq), daemon=True)
+            self._thread.start()
+
+    def _write_snapshot(self, state, seq):
+        reminders, settings = state
+        config = {
+            "reminders": [reminder_to_json(r) for r in reminders],
+            **settings,
+            "journal_seq": seq,
+        }
+        try:
+            self._write_json(config)
+            self._truncate(seq)
+        except Exception as e:
+            print(f"Error compacting journal: {e}")
+
+    def _write_json(self, config):
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+
+    def _truncate(self, seq):
+        # Keep only records appended after the snapshot was taken
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._rewrite([r for r in self.read() if r.get("seq", 0) > seq])
+
+    def _rewrite(self, records):
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+class SqliteStorage:
+    """SQLite backend (WAL mode) used instead of config.json and the journal."""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reminders (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            datetime TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS history (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            datetime TEXT NOT NULL,
+            flags INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS history_datetime ON history (datetime);
+        DROP INDEX IF EXISTS reminders_datetime;
+        DROP INDEX IF EXISTS reminders_title;
+        DROP INDEX IF EXISTS history_title;
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path=DATABASE_FILE):
+        self.path = Path(path)
+        is_new = not self.path.exists()
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(history)")}
+        if "flags" not in columns:
+            self.conn.execute("ALTER TABLE history ADD COLUMN flags INTEGER NOT NULL DEFAULT 0")
+        if is_new:
+            self._import_json()
+
+    def _import_json(self):
+        # First run on SQLite: carry over whatever the JSON backend had
+        reminders, history, settings = ReminderJournal().load()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO reminders (id, title, datetime) VALUES (?, ?, ?)",
+                [(r.id, r.title, r.datetime.isoformat()) for r in reminders])
+            self.conn.executemany(
+                "INSERT INTO history (id, title, datetime, flags) VALUES (?, ?, ?, ?)",
+                [(r.id, r.title, r.datetime.isoformat(), r.flags) for r in history])
+            self._save_settings(settings)
+
+    def _save_settings(self, settings):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [(k, json.dumps(v)) for k, v in settings.items()])
+
+    def load(self):
+        rows = self.conn.execute("SELECT id, title, datetime FROM reminders ORDER BY rowid")
+        reminders = [Reminder.from_datetime(t, datetime.fromisoformat(d), i) for i, t, d in rows]
+        settings = default_settings()
+        for key, value in self.conn.execute("SELECT key, value FROM settings"):
+            if key in settings:
+                settings[key] = json.loads(value)
+        return reminders, SqliteHistory(self.conn, settings["history_retention_months"]), settings
+
+    def append(self, record):
+        op = record.get("op")
+        with self.conn:
+            if op == "add":
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO reminders (id, title, datetime) VALUES (?, ?, ?)",
+                    (record["id"], record["title"], record["datetime"]))
+            elif op == "edit":
+                self.conn.execute(
+                    "UPDATE reminders SET title = ?, datetime = ? WHERE id = ?",
+                    (record["title"], record["datetime"], record["id"]))
+            elif op in ("delete", "expire"):
+                flags = REMINDER_DELETED if op == "delete" else REMINDER_EXPIRED
+                self.conn.execute(
+                    "INSERT INTO history (id, title, datetime, flags) "
+                    "SELECT id, title, datetime, ? FROM reminders WHERE id = ?", (flags, record["id"]))
+                self.conn.execute("DELETE FROM reminders WHERE id = ?", (record["id"],))
+            elif op == "settings":
+                self._save_settings({k: v for k, v in record.items() if k != "op"})
+
+    def compact(self, wait=False):
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+class SqliteHistory:
+    """History table paged by seq, with old months in HistorySegments."""
+    PAGE_SIZE = 500
+
+    def __init__(self, conn, retention_months):
+        self.conn = conn
+        self.retention_months = retention_months
+        self.segments = HistorySegments()
+        self._older = []  # entries loaded back from segments, oldest first
+        self._cold = []
+        self._count = None  # unknown until first use
+
+    def _ensure_loaded(self):
+        if self._count is not None:
+            return
+        self._archive_expired(retention_cutoff(self.retention_months))
+        self._cold = self.segments.months()
+        self._count = self.conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def warm_up(self):
+        # The connection belongs to the GUI thread, so this runs in idle time there
+        self._ensure_loaded()
+
+    def _archive_expired(self, cutoff):
+        rows = self.conn.execute(
+            "SELECT id, title, datetime, flags FROM history WHERE datetime < ? ORDER BY seq", (cutoff,)).fetchall()
+        if not rows:
+            return
+        by_month = {}
+        for i, t, d, f in rows:
+            by_month.setdefault(d[:7], []).append(Reminder.from_datetime(t, datetime.fromisoformat(d), i, f))
+        for month, entries in by_month.items():
+            self.segments.write(month, entries)
+        with self.conn:
+            self.conn.execute("DELETE FROM history WHERE datetime < ?", (cutoff,))
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._older) + self._count
+
+    def append(self, reminder):
+        # The row itself is written by SqliteStorage.append
+        if self._count is not None:
+            self._count += 1
+
+    def page(self, offset, limit):
+        self._ensure_loaded()
+        result = self._older[offset:offset + limit]
+        offset = max(offset - len(self._older), 0)
+        limit -= len(result)
+        if limit > 0:
+            rows = self.conn.execute(
+                "SELECT id, title, datetime, flags FROM history ORDER BY seq LIMIT ? OFFSET ?", (limit, offset))
+            result += [Reminder.from_datetime(t, datetime.fromisoformat(d), i, f) for i, t, d, f in rows]
+        return result
+
+    def __iter__(self):
+        offset = 0
+        while True:
+            rows = self.page(offset, self.PAGE_SIZE)
+            if not rows:
+                return
+            yield from rows
+            offset += len(rows)
+
+    def has_older(self):
+        self._ensure_loaded()
+        return bool(self._cold)
+
+    def cold_months(self):
+        self._ensure_loaded()
+        return list(self._cold)
+
+    def load_older(self):
+        self._ensure_loaded()
+        if not self._cold:
+            return []
+        older = self.segments.read(self._cold.pop())
+        self._older[0:0] = older
+        return older
+
+def save_config():
+    storage.compact(wait=True)
 
 def load_config():
-    global reminders, history, use_custom_image, use_custom_sound
-    global selected_image, selected_sound, dark_mode
-
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-        reminders = [
-            {"title": r["title"], "datetime": datetime.fromisoformat(r["datetime"])}
-            for r in config.get("reminders", [])
-        ]
-        history = [
-            {"title": r["title"], "datetime": datetime.fromisoformat(r["datetime"])}
-            for r in config.get("history", [])
-        ]
-        use_custom_image = config.get("use_custom_image", False)
-        use_custom_sound = config.get("use_custom_sound", False)
-        selected_image = config.get("selected_image", None)
-        selected_sound = config.get("selected_sound", None)
-        dark_mode = config.get("dark_mode", False) 
-        for r in reminders:
-            schedule_notification(r["title"], r["datetime"])
+    global use_custom_image, use_custom_sound
+    global selected_image, selected_sound, dark_mode, history_retention_months, web_cache_mb
+
+    reminders, history, settings = storage.load()
+    use_custom_image = settings["use_custom_image"]
+    use_custom_sound = settings["use_custom_sound"]
+    selected_image = settings["selected_image"]
+    selected_sound = settings["selected_sound"]
+    dark_mode = settings["dark_mode"]
+    history_retention_months = settings["history_retention_months"]
+    web_cache_mb = settings["web_cache_mb"]
+    store.load(reminders, history)
+    for r in store.reminders:
+        schedule_notification(r)
+
+def open_storage():
+    # Once reminders.db exists the SQLite backend sticks
+    if get_option("storage") == "sqlite" or DATABASE_FILE.exists():
+        return SqliteStorage()
+    return ReminderJournal()
+
+class StartupProfile(QObject):
+    """--profile-startup: prints how long each startup phase took."""
+    TARGET_MS = 1500  # cold start budget, window painted
+
+    def __init__(self, enabled):
+        super().__init__()
+        self.enabled = enabled
+        self.last = STARTUP_T0
+        self.phases = []
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def finish_on_paint(self, widget):
+        if self.enabled:
+            widget.installEventFilter(self)
+
+    def finish(self, phase):
+        if not self.enabled:
+            return
+        self.mark(phase)
+        total = (self.last - STARTUP_T0) * 1000
+        for name, ms in self.phases:
+            print(f"[startup] {name:<16} {ms:8.1f} ms")
+        status = "OK" if total <= self.TARGET_MS else "OVER TARGET"
+        print(f"[startup] {'total':<16} {total:8.1f} ms (target {self.TARGET_MS} ms, {status})")
+        self.enabled = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.finish("first paint")
+        return False
 
 if __name__ == "__main__":
+    profile = StartupProfile("--profile-startup" in sys.argv)
+    profile.mark("imports")
+    # Required to import QtWebEngineWidgets after the QApplication exists
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
+    profile.mark("QApplication")
+    store = ReminderStore()
+    storage = open_storage()
+    backend = get_option("scheduler", "qt")
+    scheduler = SCHEDULER_BACKENDS.get(backend, QtTimerScheduler)(fire_reminder)
     
     # Load config first
     load_config()
+    store.storage = storage
+    profile.mark("load_config")
     
     # Create window
+    rendition_cache = RenditionCache()
     window = MainWindow()
 
     # Apply loaded dark mode BEFORE showing the UI
     window.dark_mode = dark_mode
     window.theme_toggle.toggle_position = 1 if dark_mode else 0
     window.apply_theme()
+    profile.mark("window")
 
     # Continue setup
     popup_manager = PopupManager()
-    threading.Thread(target=run_scheduler, daemon=True).start()
-    threading.Thread(target=auto_delete_old_reminders, args=(window,), daemon=True).start()
+    asset_catalog = AssetCatalog()
+    sound_cache = SoundCache()
+    asset_catalog.changed.connect(sound_cache.on_assets_changed)
+    alarm_mixer = AlarmMixer()
+    scheduler.start()
     app.aboutToQuit.connect(save_config)
-    window.show()
+    app.aboutToQuit.connect(window.release_web_view)
+    profile.mark("services")
+    # --minimized starts in the tray without touching QtWebEngine
+    if "--minimized" not in sys.argv:
+        profile.finish_on_paint(window)
+        window.show()
+    else:
+        QTimer.singleShot(0, lambda: profile.finish("event loop"))
+    # Materialize the history once the UI is idle instead of during startup
+    QTimer.singleShot(3000, store.history.warm_up)
+    QTimer.singleShot(3000, sound_cache.warm_up)
     sys.exit(app.exec_())